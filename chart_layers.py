@@ -0,0 +1,284 @@
+"""
+축구장 위에 그리는 데이터 레이어 공용 모듈
+한 경기뿐 아니라 여러 경기를 합친 배열도 그대로 그릴 수 있도록 계산과 그리기를 나눔
+
+- extract_shots: 특정 팀의 슛 위치와 카테고리(Goal, On Target, Off Target) 배열 추출
+- draw_shot_layer: 카테고리별로 scatter 한 번씩 그림
+- draw_shot_map_array: 슛 배열(여러 경기 가능)로 슛 맵 Figure 생성
+- extract_event_chains: 슛으로 끝나는 이벤트 체인(슛, 키패스, 그 전 패스들) 추출
+- draw_event_chain_layer: 이벤트 체인을 카테고리별 quiver 한 번, 번호별 scatter 한 번으로 그림
+- starting_players: 라인업에서 선발 선수 이름 추출
+- pass_network_tables: 패스 네트워크의 선수(node) 표와 연결(edge) 표 계산
+- draw_pass_network_layer: 연결선은 LineCollection 하나, 선수는 scatter 하나로 그림
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from pitch import draw_soccer_field
+from match_context import as_match_context
+
+# 슛 카테고리별 색 (범례 순서)
+SHOT_CATEGORY_COLORS = {"Goal": "green", "On Target": "blue", "Off Target": "red"}
+
+# 유효 슛으로 보는 슛 결과 (기본값)
+ON_TARGET_SHOT_OUTCOMES = ("Saved", "Post")
+
+# 이벤트 체인에서 유효 슛으로 보는 슛 결과
+CHAIN_ON_TARGET_OUTCOMES = ("Goal", "Saved", "Post", "Saved Off Target", "Saved to Post", "Blocked")
+
+# 이벤트 체인 카테고리별 색과 투명도 (범례 순서)
+CHAIN_CATEGORY_STYLES = {"On Target": ("red", 1.0), "Off Target": ("gray", 0.4)}
+
+
+def shot_categories(shot_outcomes, on_target_outcomes=ON_TARGET_SHOT_OUTCOMES):
+    """
+    슛 결과 이름 배열을 카테고리 배열로 변환하는 함수
+
+    매개변수:
+    - shot_outcomes: 슛 결과 이름 리스트 또는 배열
+    - on_target_outcomes: 유효 슛으로 보는 결과 이름
+
+    반환값:
+    - np.ndarray: "Goal", "On Target", "Off Target" 배열
+    """
+    shot_outcomes = np.asarray(shot_outcomes, dtype=object)
+    return np.where(shot_outcomes == "Goal", "Goal",
+                    np.where(np.isin(shot_outcomes, list(on_target_outcomes)), "On Target", "Off Target"))
+
+
+def extract_shots(events_data, team_name, on_target_outcomes=ON_TARGET_SHOT_OUTCOMES):
+    """
+    특정 팀의 슛 위치와 카테고리를 추출하는 함수
+
+    매개변수:
+    - events_data: 이벤트 iterable
+    - team_name (str): 팀 이름
+    - on_target_outcomes: 유효 슛으로 보는 결과 이름
+
+    반환값:
+    - np.ndarray: (N, 2) 슛 위치
+    - np.ndarray: (N,) 슛 카테고리
+    """
+    shot_locations = []
+    shot_outcomes = []
+    for event in events_data:
+        if event["type"]["name"] == "Shot" and event["team"]["name"] == team_name:
+            shot_locations.append(event["location"][:2])
+            shot_outcomes.append(event["shot"]["outcome"]["name"])
+
+    return np.asarray(shot_locations, dtype=float).reshape(-1, 2), shot_categories(shot_outcomes, on_target_outcomes)
+
+
+def draw_shot_layer(ax, shot_locations, shot_categories, s=100):
+    """
+    슛 위치를 카테고리별 scatter 한 번씩으로 그리는 함수 (슛 개수와 상관없이 artist 는 최대 3개)
+
+    매개변수:
+    - ax (matplotlib.axes): 그릴 축
+    - shot_locations: (N, 2) 슛 위치 (여러 경기를 합친 배열도 가능)
+    - shot_categories: (N,) 슛 카테고리
+    - s: 점 크기
+    """
+    shot_locations = np.asarray(shot_locations, dtype=float).reshape(-1, 2)
+    shot_categories = np.asarray(shot_categories)
+    for category, color in SHOT_CATEGORY_COLORS.items():
+        mask = shot_categories == category
+        if mask.any():
+            ax.scatter(shot_locations[mask, 0], shot_locations[mask, 1], c=color, s=s, label=category)
+    return ax
+
+
+def draw_shot_map_array(shot_locations, shot_categories, title, side=None, s=100):
+    """
+    슛 배열로 슛 맵을 그리는 함수 (시즌 전체처럼 여러 경기를 합친 슛도 한 번에 그림)
+
+    매개변수:
+    - shot_locations: (N, 2) 슛 위치
+    - shot_categories: (N,) 슛 카테고리
+    - title (str): 제목
+    - side (str): "home" 또는 "away" 진영 표시 (None 이면 표시하지 않음)
+
+    반환값:
+    - matplotlib.figure.Figure: 슛 맵
+    """
+    fig, ax = plt.subplots(figsize=(12, 8))
+    ax = draw_soccer_field(ax, side)
+    draw_shot_layer(ax, shot_locations, shot_categories, s)
+
+    ax.legend()
+    plt.title(title, fontsize=14)
+    plt.axis("off")
+    return fig
+
+
+def extract_event_chains(events, team_name, chain_length=3, min_x=60):
+    """
+    특정 팀의 슛으로 끝나는 이벤트 체인을 추출하는 함수
+    슛 -> 키패스 -> 그 전의 같은 팀 패스 ... 순서로 거슬러 올라감
+
+    매개변수:
+    - events: MatchContext, 이벤트 리스트 또는 이벤트 파일 경로
+    - team_name (str): 팀 이름
+    - chain_length (int): 체인에 포함할 최대 이벤트 수 (슛 포함, 기본 3: 슛, 키패스, 그 전 패스)
+    - min_x (float): 키패스 이전 패스는 연결되는 두 위치가 모두 이 x 이상(상대 진영)일 때만 포함
+
+    반환값:
+    - list: (위치 배열 (k, 2) (슛부터 거꾸로), 카테고리 "On Target" 또는 "Off Target") 리스트
+    """
+    match = as_match_context(events)
+
+    chains = []
+    for shot in match.team_events("Shot", team_name):
+        key_pass_id = shot.get("shot", {}).get("key_pass_id")
+        key_pass = match.event(key_pass_id) if key_pass_id else None
+        # 키패스가 없는 슛은 체인을 만들지 않음
+        if key_pass is None or key_pass["type"]["name"] != "Pass":
+            continue
+
+        locations = [shot["location"][:2], key_pass["location"][:2]]
+        current = key_pass
+        while len(locations) < chain_length:
+            previous = match.previous_team_pass(current["id"], team_name)
+            if previous is None or current["location"][0] < min_x or previous["location"][0] < min_x:
+                break
+            locations.append(previous["location"][:2])
+            current = previous
+
+        outcome = shot.get("shot", {}).get("outcome", {}).get("name")
+        category = "On Target" if outcome in CHAIN_ON_TARGET_OUTCOMES else "Off Target"
+        chains.append((np.asarray(locations, dtype=float), category))
+    return chains
+
+
+def draw_event_chain_layer(ax, chains, fontsize=10):
+    """
+    이벤트 체인을 화살표와 번호로 그리는 함수
+    화살표는 카테고리별 quiver 한 번, 번호는 순서별 scatter(숫자 마커) 한 번으로 그려서 체인 수와 상관없이 artist 수가 일정
+
+    매개변수:
+    - ax (matplotlib.axes): 그릴 축
+    - chains (list): extract_event_chains 결과 (여러 경기를 합친 리스트도 가능)
+    - fontsize: 번호 크기
+    """
+    for category, (color, alpha) in CHAIN_CATEGORY_STYLES.items():
+        selected = [locations for locations, chain_category in chains if chain_category == category]
+        if not selected:
+            continue
+
+        # 이전 이벤트 -> 다음 이벤트 화살표 (체인은 슛부터 거꾸로 저장되어 있음)
+        starts = np.concatenate([locations[1:] for locations in selected])
+        ends = np.concatenate([locations[:-1] for locations in selected])
+        ax.quiver(starts[:, 0], starts[:, 1], ends[:, 0] - starts[:, 0], ends[:, 1] - starts[:, 1],
+                  angles="xy", scale_units="xy", scale=1, color=color, alpha=alpha,
+                  width=0.003, headwidth=4, headlength=5, zorder=3)
+
+        # 슛 위치 (범례용)
+        shots = np.array([locations[0] for locations in selected])
+        ax.scatter(shots[:, 0], shots[:, 1], color=color, s=1, label=category)
+
+    # 자연수 표시 (1: 슛, 2: 키패스, 3: 그 전 패스, ...)
+    max_length = max((len(locations) for locations, _ in chains), default=0)
+    for step in range(max_length):
+        points = np.array([locations[step] for locations, _ in chains if len(locations) > step])
+        ax.scatter(points[:, 0], points[:, 1], marker=f"${step + 1}$", s=fontsize ** 2, color="black",
+                   alpha=0.6, linewidths=0, zorder=4)
+    return ax
+
+
+def starting_players(lineup_info):
+    """
+    라인업(팀 하나)에서 선발 명단(Starting XI) 선수 이름 리스트를 추출
+    """
+    players = []
+    for player in lineup_info['lineup']:
+        if any(position["start_reason"] == "Starting XI" for position in player.get("positions", [])):
+            players.append(player['player_name'])
+    return players
+
+
+def pass_network_tables(events_data, team_name, players):
+    """
+    패스 네트워크의 선수 표와 연결 표를 계산하는 함수 (그리기와 분리되어 있어 워커 프로세스에서 계산 가능)
+    선수 위치는 보낸 패스의 시작 위치와 받은 패스의 도착 위치 평균
+
+    매개변수:
+    - events_data: 이벤트 iterable
+    - team_name (str): 팀 이름
+    - players (list): 네트워크에 포함할 선수 이름 (보통 선발 명단)
+
+    반환값:
+    - dict: 선수 표 {'player': 이름, 'position': (n, 2) 평균 위치, 'touches': 위치 개수,
+            'involvement': 선발 선수끼리 보내고 받은 패스 수}
+    - dict: 연결 표 {'passer', 'recipient': 선수 번호(players 순서), 'count': 패스 수,
+            'start', 'end': (m, 2) 보낸/받은 선수의 평균 위치}
+    """
+    player_index = {player: i for i, player in enumerate(players)}
+    num_players = len(players)
+
+    passers, recipients, starts, ends = [], [], [], []
+    for event in events_data:
+        if event["type"]["name"] == "Pass" and event["team"]["name"] == team_name:
+            recipient = event["pass"].get("recipient", {}).get("name")
+            passer_id = player_index.get(event["player"]["name"], -1)
+            recipient_id = player_index.get(recipient, -1)
+            if passer_id < 0 and recipient_id < 0:
+                continue
+            passers.append(passer_id)
+            recipients.append(recipient_id)
+            starts.append(event["location"][:2])
+            ends.append(event["pass"]["end_location"][:2] if recipient_id >= 0 else (np.nan, np.nan))
+
+    passers = np.asarray(passers, dtype=int)
+    recipients = np.asarray(recipients, dtype=int)
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+
+    # 선수별 평균 위치 (보낸 패스 시작 위치 + 받은 패스 도착 위치)
+    node_ids = np.concatenate([passers[passers >= 0], recipients[recipients >= 0]])
+    node_locations = np.concatenate([starts[passers >= 0], ends[recipients >= 0]])
+    touches = np.bincount(node_ids, minlength=num_players)
+    sums = np.zeros((num_players, 2))
+    np.add.at(sums, node_ids, node_locations)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        positions = sums / touches[:, None]
+
+    # 선발 선수끼리의 패스를 (보낸 선수, 받은 선수) 쌍으로 묶어서 카운트
+    both = (passers >= 0) & (recipients >= 0)
+    pairs, counts = np.unique(passers[both] * num_players + recipients[both], return_counts=True)
+    edge_passers, edge_recipients = pairs // num_players, pairs % num_players
+
+    # 각 선수의 총 패스 수 (보낸 패스 + 받은 패스)
+    involvement = (np.bincount(edge_passers, weights=counts, minlength=num_players) +
+                   np.bincount(edge_recipients, weights=counts, minlength=num_players))
+
+    nodes = {"player": np.asarray(players, dtype=object), "position": positions, "touches": touches,
+             "involvement": involvement}
+    edges = {"passer": edge_passers, "recipient": edge_recipients, "count": counts,
+             "start": positions[edge_passers], "end": positions[edge_recipients]}
+    return nodes, edges
+
+
+def draw_pass_network_layer(ax, nodes, edges, node_scale=5, width_scale=0.5):
+    """
+    패스 네트워크를 그리는 함수 (연결선은 LineCollection 하나, 선수 위치는 scatter 하나)
+
+    매개변수:
+    - ax (matplotlib.axes): 그릴 축
+    - nodes, edges (dict): pass_network_tables 결과
+    - node_scale: 선수 점 크기 = 총 패스 수 * node_scale
+    - width_scale: 연결선 두께 = 패스 수 * width_scale
+    """
+    # 패스 연결선 그리기
+    segments = np.stack([edges["start"], edges["end"]], axis=1)
+    ax.add_collection(LineCollection(segments, colors="blue", linewidths=edges["count"] * width_scale,
+                                     alpha=0.7, zorder=2))
+
+    # 선수 위치와 이름 표시 (위치가 있는 선수만)
+    has_position = nodes["touches"] > 0
+    positions = nodes["position"][has_position]
+    ax.scatter(positions[:, 0], positions[:, 1], c="red", s=nodes["involvement"][has_position] * node_scale,
+               edgecolor="black", zorder=5)
+    for player, (x, y) in zip(nodes["player"][has_position], positions):
+        ax.text(x, y + 2, player, fontsize=10, ha="center", zorder=6)
+    return ax
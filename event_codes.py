@@ -0,0 +1,101 @@
+"""
+컬럼 파일(.npz)의 정수 코드(type_id, team_id, player_id, outcome_id, card_id ...)로 이벤트를 고르는 모듈
+이벤트마다 중첩된 딕셔너리의 문자열을 비교하는 대신, 이름을 경기별로 한 번만 코드로 바꾸고 boolean 마스크로 계산한다
+(통계치 계산은 metric_plan 참고)
+
+- as_event_store: EventTable, 컬럼 파일 경로 또는 (columns, names) 를 받아 (columns, names) 반환
+- codes / is_code: 이름 -> 정수 코드, 코드 마스크
+- side_team / team_order: 홈/어웨이 팀 코드, 이벤트에 처음 나온 순서의 팀 코드
+- linked_to_opponent: related_events 로 상대 팀 이벤트와 연결된 이벤트 마스크
+- locations: 마스크에 해당하는 (N, 2) 위치 배열
+"""
+import os
+
+import numpy as np
+
+from event_store import load_event_store
+
+
+def as_event_store(source):
+    """
+    컬럼 파일 경로(.npz) 또는 load_event_store 결과를 (columns, names) 로 반환
+    (이벤트 리스트나 JSON 경로처럼 컬럼 형태가 아니면 None)
+    """
+    if isinstance(source, tuple) and len(source) == 2 and isinstance(source[0], dict):
+        return source
+    if hasattr(source, "columns") and hasattr(source, "names"):
+        return source.columns, source.names
+    if isinstance(source, (str, os.PathLike)) and str(source).endswith(".npz"):
+        return load_event_store(source)
+    return None
+
+
+def codes(names, kind, labels):
+    """
+    이름 테이블에서 labels 에 해당하는 정수 코드 배열을 구하는 함수
+
+    매개변수:
+    - names (dict): load_event_store 의 이름 테이블
+    - kind (str): "type", "team", "player", "outcome", "pass_type", "card"
+    - labels: 이름 또는 이름 리스트
+
+    반환값:
+    - np.ndarray: 정수 코드 (경기에 없는 이름은 제외)
+    """
+    if isinstance(labels, str):
+        labels = [labels]
+    labels = set(labels)
+    return np.array([code for code, name in names[kind].items() if name in labels], dtype=np.int64)
+
+
+def is_code(column, names, kind, labels):
+    """
+    column 값이 labels 의 코드 중 하나인지 나타내는 boolean 마스크
+    """
+    return np.isin(column, codes(names, kind, labels))
+
+
+def side_team(columns, side):
+    """
+    "home" 또는 "away" 에 해당하는 팀 코드 (첫 번째, 두 번째 이벤트의 팀 = Starting XI 순서)
+    """
+    return int(columns["team_id"][0 if side.lower() == "home" else 1])
+
+
+def team_order(columns):
+    """
+    이벤트에 처음 나온 순서대로의 팀 코드 배열 (Starting XI 기준 홈, 어웨이 순)
+    """
+    team_ids = columns["team_id"]
+    unique, first = np.unique(team_ids[team_ids != -1], return_index=True)
+    return unique[np.argsort(first)]
+
+
+def linked_to_opponent(columns):
+    """
+    related_events 로 다른 팀(또는 팀 없는) 이벤트와 연결된 이벤트 마스크
+    (드리블 실패: 상대 팀 이벤트와 연결된 Carry)
+    """
+    team_id = columns["team_id"]
+    # related_events 를 (이벤트 행, 연결된 행) 쌍으로 펼침
+    offsets, related_index = columns["related_offsets"], columns["related_index"]
+    rows = np.repeat(np.arange(len(team_id)), np.diff(offsets))
+    valid = related_index >= 0
+    rows, related_rows = rows[valid], related_index[valid]
+    linked_rows = rows[team_id[related_rows] != team_id[rows]]
+    return np.bincount(linked_rows, minlength=len(team_id)) > 0
+
+
+def locations(columns, mask, end=False):
+    """
+    mask 에 해당하는 이벤트의 위치를 (N, 2) 배열로 반환 (위치가 없는 이벤트는 제외)
+
+    매개변수:
+    - columns (dict): load_event_store 의 컬럼 배열
+    - mask (np.ndarray): 이벤트 행 boolean 마스크
+    - end (bool): True 이면 도착 위치 (end_x, end_y)
+    """
+    x, y = (columns["end_x"], columns["end_y"]) if end else (columns["x"], columns["y"])
+    points = np.column_stack([x[mask], y[mask]])
+    return points[~np.isnan(points).any(axis=1)]
+
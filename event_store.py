@@ -0,0 +1,371 @@
+"""
+StatsBomb 이벤트 JSON 파일을 컬럼 형태(.npz)로 한 번만 변환해 두고 다시 읽어오는 모듈
+
+- ColumnBuilder / events_to_columns: 이벤트(하나씩 또는 리스트) -> 컬럼 배열 변환
+- ingest_events: 이벤트 JSON -> 컬럼 파일(.npz) 변환 (기본은 parse_cache 의 캐시 폴더에 저장)
+- load_event_store: 컬럼 파일을 numpy 배열 딕셔너리로 로드
+- load_events: 경로(.json / .npz) 또는 이미 로드된 이벤트를 받아 이벤트 리스트 반환
+"""
+import os
+import json
+import argparse
+import numpy as np
+from tqdm import tqdm
+
+from parse_cache import cache_enabled, cached_file, load_json
+
+# 컬럼별 자료형 (없는 값: 정수 -1, 실수 nan, 문자열 '')
+COLUMNS = {
+    "id": "U36",
+    "index": np.int32,
+    "period": np.int8,
+    "timestamp": np.float64,        # 초 단위
+    "minute": np.int16,
+    "second": np.int16,
+    "type_id": np.int16,
+    "team_id": np.int32,
+    "possession_team_id": np.int32,
+    "player_id": np.int32,
+    "recipient_id": np.int32,
+    "x": np.float64,
+    "y": np.float64,
+    "end_x": np.float64,
+    "end_y": np.float64,
+    "duration": np.float64,
+    "outcome_id": np.int16,         # pass/shot/duel/dribble 등 타입별 outcome
+    "pass_type_id": np.int16,       # Corner, Free Kick ...
+    "card_id": np.int16,            # foul_committed / bad_behaviour 카드
+    "key_pass_id": "U36",
+}
+
+# id -> 이름 테이블 종류
+NAME_TABLES = ["type", "team", "player", "outcome", "pass_type", "card"]
+
+# 타입 이름과 세부 정보 키 이름이 규칙에서 벗어나는 경우
+SECTION_ALIASES = {"Goal Keeper": "goalkeeper"}
+
+# end_location 을 가지고 있는 이벤트 구역
+END_LOCATION_SECTIONS = ["pass", "carry", "shot"]
+
+
+def section_name(type_name):
+    """
+    이벤트 타입 이름으로 타입별 세부 정보가 들어있는 키 이름을 구하는 함수
+    예) "Foul Committed" -> "foul_committed", "Ball Receipt*" -> "ball_receipt"
+    """
+    if type_name in SECTION_ALIASES:
+        return SECTION_ALIASES[type_name]
+    return type_name.replace("*", "").strip().lower().replace(" ", "_")
+
+
+def parse_timestamp(timestamp):
+    """
+    "HH:MM:SS.fff" 형식의 타임스탬프를 초 단위 실수로 변환
+    """
+    if not timestamp:
+        return np.nan
+    hours, minutes, seconds = timestamp.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+class ColumnBuilder:
+    """
+    이벤트를 하나씩 받아서 컬럼 값으로 쌓는 클래스 (스트리밍으로 읽는 이벤트도 전체 리스트 없이 변환)
+    related_events 는 모든 이벤트를 받은 뒤 finish 에서 행 번호로 바꾼다
+    """
+
+    def __init__(self):
+        self.names = {kind: {} for kind in NAME_TABLES}
+        self.values = {name: [] for name in COLUMNS}
+        self.related_ids = []
+        self.related_counts = []
+
+    def _add_name(self, kind, item):
+        if not item:
+            return -1
+        self.names[kind][item["id"]] = item["name"]
+        return item["id"]
+
+    def add(self, event):
+        """
+        이벤트 하나를 컬럼 값에 추가
+        """
+        values = self.values
+        add_name = self._add_name
+        type_name = event["type"]["name"]
+        detail = event.get(section_name(type_name), {})
+
+        location = event.get("location") or [np.nan, np.nan]
+        end_location = [np.nan, np.nan]
+        for section in END_LOCATION_SECTIONS:
+            if "end_location" in event.get(section, {}):
+                end_location = event[section]["end_location"]
+                break
+
+        card = event.get("foul_committed", {}).get("card") or event.get("bad_behaviour", {}).get("card")
+
+        values["id"].append(event["id"])
+        values["index"].append(event.get("index", len(self.related_counts) + 1))
+        values["period"].append(event.get("period", 0))
+        values["timestamp"].append(parse_timestamp(event.get("timestamp")))
+        values["minute"].append(event.get("minute", 0))
+        values["second"].append(event.get("second", 0))
+        values["type_id"].append(add_name("type", event["type"]))
+        values["team_id"].append(add_name("team", event.get("team")))
+        values["possession_team_id"].append(add_name("team", event.get("possession_team")))
+        values["player_id"].append(add_name("player", event.get("player")))
+        values["recipient_id"].append(add_name("player", event.get("pass", {}).get("recipient")))
+        values["x"].append(location[0])
+        values["y"].append(location[1])
+        values["end_x"].append(end_location[0])
+        values["end_y"].append(end_location[1])
+        values["duration"].append(event.get("duration", 0))
+        values["outcome_id"].append(add_name("outcome", detail.get("outcome")))
+        values["pass_type_id"].append(add_name("pass_type", event.get("pass", {}).get("type")))
+        values["card_id"].append(add_name("card", card))
+        values["key_pass_id"].append(event.get("shot", {}).get("key_pass_id", ""))
+
+        related_events = event.get("related_events", [])
+        self.related_ids.extend(related_events)
+        self.related_counts.append(len(related_events))
+
+    def finish(self):
+        """
+        쌓은 값을 컬럼 배열로 변환
+
+        반환값:
+        - dict: 컬럼 이름 -> numpy 배열 (related_offsets, related_index 포함)
+        - dict: 테이블 종류 -> {id: 이름}
+        """
+        # related_events 는 id 대신 행 번호로 저장
+        row_of_id = {event_id: i for i, event_id in enumerate(self.values["id"])}
+        related_offsets = np.zeros(len(self.related_counts) + 1, dtype=np.int32)
+        np.cumsum(self.related_counts, out=related_offsets[1:])
+
+        columns = {name: np.array(self.values[name], dtype=dtype) for name, dtype in COLUMNS.items()}
+        columns["related_offsets"] = related_offsets
+        columns["related_index"] = np.array([row_of_id.get(related_id, -1) for related_id in self.related_ids],
+                                            dtype=np.int32)
+        return columns, self.names
+
+
+def events_to_columns(events_data):
+    """
+    이벤트 리스트(list of dict)를 컬럼 배열로 변환하는 함수
+
+    매개변수:
+    - events_data: json.load 로 읽은 이벤트 리스트 (또는 이벤트를 하나씩 반환하는 iterable)
+
+    반환값:
+    - dict: 컬럼 이름 -> numpy 배열 (related_offsets, related_index 포함)
+    - dict: 테이블 종류 -> {id: 이름}
+    """
+    builder = ColumnBuilder()
+    for event in events_data:
+        builder.add(event)
+    return builder.finish()
+
+
+def default_store_path(events_file_path, store_dir=None):
+    """
+    이벤트 JSON 경로에 대응하는 컬럼 파일 경로
+    store_dir 가 없으면 events 폴더 옆의 events_npz 폴더를 사용
+    """
+    events_dir, filename = os.path.split(os.path.abspath(events_file_path))
+    if store_dir is None:
+        store_dir = os.path.join(os.path.dirname(events_dir), "events_npz")
+    return os.path.join(store_dir, os.path.splitext(filename)[0] + ".npz")
+
+
+def save_event_store(store_path, columns, names):
+    """
+    컬럼 배열과 이름 테이블을 .npz 파일 하나로 저장
+    """
+    arrays = dict(columns)
+    for kind, table in names.items():
+        arrays[f"names_{kind}_id"] = np.array(list(table.keys()), dtype=np.int32)
+        arrays[f"names_{kind}"] = np.array(list(table.values()), dtype=str)
+
+    os.makedirs(os.path.dirname(os.path.abspath(store_path)), exist_ok=True)
+    tmp_path = store_path + ".tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, store_path)
+
+
+def ingest_events(events_file_path, store_path=None, overwrite=False):
+    """
+    이벤트 JSON 파일을 한 번만 디코딩해서 컬럼 파일(.npz)로 저장하는 함수
+
+    매개변수:
+    - events_file_path (str): 경기 이벤트 JSON 파일 경로
+    - store_path (str): 저장할 .npz 경로 (없으면 캐시 폴더, 캐시를 끄면 default_store_path 사용)
+    - overwrite (bool): 이미 최신 컬럼 파일이 있어도 다시 변환할지 여부
+
+    반환값:
+    - str: 컬럼 파일 경로
+    """
+    def build(path):
+        with open(events_file_path, 'r', encoding='utf-8') as f:
+            events_data = json.load(f)
+        save_event_store(path, *events_to_columns(events_data))
+
+    if store_path is None:
+        if cache_enabled():
+            # 경로, 크기, 수정 시간이 같은 파일은 캐시된 컬럼 파일 사용 (JSON 을 읽지 않음)
+            return cached_file(events_file_path, "events", ".npz", build, overwrite)
+        store_path = default_store_path(events_file_path)
+
+    # JSON 보다 새로운 컬럼 파일이 있으면 재사용
+    if not overwrite and os.path.exists(store_path) and \
+            os.path.getmtime(store_path) >= os.path.getmtime(events_file_path):
+        return store_path
+
+    build(store_path)
+    return store_path
+
+
+def ingest_events_folder(events_dir, store_dir=None, overwrite=False):
+    """
+    events 폴더의 모든 JSON 파일을 컬럼 파일로 변환 (store_dir 가 없으면 캐시 폴더)
+
+    반환값:
+    - list: 변환된 컬럼 파일 경로 리스트
+    """
+    filenames = sorted(f for f in os.listdir(events_dir) if f.endswith('.json'))
+    store_paths = []
+    for filename in tqdm(filenames, desc="Ingesting events", unit="match"):
+        events_file_path = os.path.join(events_dir, filename)
+        store_path = default_store_path(events_file_path, store_dir) if store_dir is not None else None
+        store_paths.append(ingest_events(events_file_path, store_path, overwrite))
+    return store_paths
+
+
+def load_event_store(store_path):
+    """
+    컬럼 파일(.npz)을 로드하는 함수
+
+    반환값:
+    - dict: 컬럼 이름 -> numpy 배열
+    - dict: 테이블 종류 -> {id: 이름}
+    """
+    with np.load(store_path, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+
+    names = {}
+    for kind in NAME_TABLES:
+        ids = arrays.pop(f"names_{kind}_id")
+        labels = arrays.pop(f"names_{kind}")
+        names[kind] = dict(zip(ids.tolist(), labels.tolist()))
+    return arrays, names
+
+
+def event_dict(values, names, related_ids=None):
+    """
+    한 이벤트의 컬럼 값을 기존 함수들이 사용하는 이벤트 딕셔너리로 되돌리는 함수
+    (프로젝트에서 사용하는 필드만 복원)
+
+    매개변수:
+    - values: 컬럼 이름 -> 해당 이벤트의 값 (파이썬 값)
+    - names (dict): 테이블 종류 -> {id: 이름}
+    - related_ids (list): related_events 의 event id (None 이면 related_events 없음)
+
+    반환값:
+    - dict: 이벤트 딕셔너리
+    """
+    type_name = names["type"][values["type_id"]]
+    event = {
+        "id": values["id"],
+        "index": values["index"],
+        "period": values["period"],
+        "minute": values["minute"],
+        "second": values["second"],
+        "type": {"id": values["type_id"], "name": type_name},
+        "duration": values["duration"],
+    }
+    for key, column in (("team", "team_id"), ("possession_team", "possession_team_id"), ("player", "player_id")):
+        item_id = values[column]
+        if item_id != -1:
+            event[key] = {"id": item_id, "name": names["player" if key == "player" else "team"][item_id]}
+
+    x, y = values["x"], values["y"]
+    if x == x:  # nan 이 아닐 때
+        event["location"] = [x, y]
+
+    detail = {}
+    outcome_id = values["outcome_id"]
+    if outcome_id != -1:
+        detail["outcome"] = {"id": outcome_id, "name": names["outcome"][outcome_id]}
+    end_x, end_y = values["end_x"], values["end_y"]
+    if end_x == end_x:
+        detail["end_location"] = [end_x, end_y]
+    if type_name == "Pass":
+        recipient_id = values["recipient_id"]
+        if recipient_id != -1:
+            detail["recipient"] = {"id": recipient_id, "name": names["player"][recipient_id]}
+        pass_type_id = values["pass_type_id"]
+        if pass_type_id != -1:
+            detail["type"] = {"id": pass_type_id, "name": names["pass_type"][pass_type_id]}
+    elif type_name == "Shot" and values["key_pass_id"]:
+        detail["key_pass_id"] = values["key_pass_id"]
+    card_id = values["card_id"]
+    if card_id != -1:
+        detail["card"] = {"id": card_id, "name": names["card"][card_id]}
+    if detail or type_name in ("Pass", "Shot"):
+        event[section_name(type_name)] = detail
+
+    if related_ids is not None:
+        event["related_events"] = related_ids
+    return event
+
+
+def columns_to_events(columns, names):
+    """
+    컬럼 배열을 기존 함수들이 사용하는 이벤트 딕셔너리 리스트로 되돌리는 함수
+    """
+    # 배열 원소 접근보다 파이썬 리스트 접근이 빠르므로 미리 변환
+    cols = {name: columns[name].tolist() for name in COLUMNS}
+    related_offsets = columns["related_offsets"].tolist()
+    related_index = columns["related_index"].tolist()
+    ids = cols["id"]
+
+    events_data = []
+    for i in range(len(ids)):
+        start, end = related_offsets[i], related_offsets[i + 1]
+        related_ids = [ids[j] for j in related_index[start:end] if j != -1] if end > start else None
+        events_data.append(event_dict({name: values[i] for name, values in cols.items()}, names, related_ids))
+    return events_data
+
+
+def load_events(source):
+    """
+    기존 함수들이 경로 대신 받을 수 있는 이벤트 로더
+
+    매개변수:
+    - source: 이벤트 JSON 경로(.json), 컬럼 파일 경로(.npz), load_event_store 결과 또는 이미 로드된 이벤트 리스트
+
+    반환값:
+    - list: 이벤트 딕셔너리 리스트
+      (JSON 경로는 원본 이벤트 그대로, 컬럼 파일과 load_event_store 결과는 COLUMNS 에 있는 필드만 복원한 이벤트)
+    """
+    if isinstance(source, tuple):
+        return columns_to_events(*source)
+
+    if not isinstance(source, (str, os.PathLike)):
+        return source
+
+    if str(source).endswith(".npz"):
+        return columns_to_events(*load_event_store(source))
+
+    # 원본 이벤트 그대로 반환 (xg, play_pattern 같은 컬럼에 없는 필드 포함, 디코딩 결과는 pickle 로 캐시)
+    return load_json(source, "events_json")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="StatsBomb 이벤트 JSON -> 컬럼 파일(.npz) 변환")
+    parser.add_argument("events_dir", help="이벤트 JSON 폴더 (open-data/data/events)")
+    parser.add_argument("--store-dir", default=None, help="컬럼 파일 저장 폴더 (기본: 캐시 폴더)")
+    parser.add_argument("--overwrite", action="store_true", help="이미 변환된 파일도 다시 변환")
+    args = parser.parse_args()
+
+    paths = ingest_events_folder(args.events_dir, args.store_dir, args.overwrite)
+    print(f"{len(paths)}개 경기 변환 완료")
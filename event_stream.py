@@ -0,0 +1,145 @@
+"""
+이벤트 JSON 파일 전체를 메모리에 올리지 않고 이벤트를 하나씩(또는 일정 개수씩) 읽는 모듈
+
+- iter_events: 이벤트를 하나씩 또는 batch_size 개씩 반환하는 제너레이터
+- iter_json_array: 최상위 JSON 배열의 원소를 조금씩 읽어서 디코딩 (ijson 이 없을 때 사용)
+"""
+import os
+import json
+
+from event_store import load_events, ColumnBuilder, save_event_store
+from event_table import EventTable
+from parse_cache import cache_enabled, cached_path, add_cached_file
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# 한 번에 읽는 파일 크기 (문자 수)
+CHUNK_SIZE = 1 << 16
+
+WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(f, chunk_size=CHUNK_SIZE):
+    """
+    최상위가 배열인 JSON 파일에서 원소를 하나씩 디코딩하는 제너레이터
+    버퍼에는 아직 디코딩하지 않은 부분만 남기므로 메모리 사용량은 원소 하나 크기 정도로 유지된다
+
+    매개변수:
+    - f: 텍스트 모드로 연 파일 객체
+    - chunk_size (int): 한 번에 읽는 문자 수
+
+    반환값:
+    - generator: 배열 원소
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # 공백과 구분자(',') 건너뛰기
+        while pos < len(buffer) and buffer[pos] in WHITESPACE + ("," if started else ""):
+            pos += 1
+
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("이벤트 파일의 최상위가 JSON 배열이 아닙니다")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # 원소가 버퍼 끝에서 잘린 경우 더 읽음
+                if eof:
+                    raise
+            else:
+                # 숫자 같은 원소는 잘려도 디코딩되므로 뒤에 구분자가 보일 때까지 기다림
+                if end < len(buffer) or eof:
+                    yield item
+                    pos = end
+                    continue
+
+        if eof:
+            raise ValueError("이벤트 파일이 배열 중간에서 끝났습니다")
+
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def iter_events(source, batch_size=None, chunk_size=CHUNK_SIZE):
+    """
+    이벤트를 하나씩 또는 batch_size 개씩 반환하는 제너레이터
+    JSON 파일은 ijson 이 설치되어 있으면 ijson 으로, 없으면 iter_json_array 로 조금씩 읽는다
+
+    매개변수:
+    - source: 이벤트 JSON 경로(.json), 컬럼 파일 경로(.npz) 또는 이미 로드된 이벤트 iterable
+    - batch_size (int): 지정하면 이벤트 리스트를 batch_size 개씩 반환 (마지막 묶음은 더 작을 수 있음)
+    - chunk_size (int): 한 번에 읽는 문자 수
+
+    반환값:
+    - generator: 이벤트 딕셔너리 (batch_size 지정 시 이벤트 리스트)
+    """
+    if batch_size is None:
+        yield from _iter_single_events(source, chunk_size)
+        return
+
+    batch = []
+    for event in _iter_single_events(source, chunk_size):
+        batch.append(event)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _iter_single_events(source, chunk_size):
+    if not isinstance(source, (str, os.PathLike)) or str(source).endswith(".npz"):
+        # 이미 로드된 이벤트 또는 컬럼 파일은 그대로 순회
+        yield from load_events(source)
+        return
+
+    if not cache_enabled():
+        yield from _stream_json(source, chunk_size)
+        return
+
+    store_path = cached_path(source, "events", ".npz")
+    table = None
+    if store_path is not None:
+        try:
+            table = EventTable.from_file(store_path)
+        except FileNotFoundError:
+            # 찾은 뒤 다른 프로세스가 LRU 정리로 지운 경우 아래에서 JSON 을 읽어서 다시 캐시
+            table = None
+    if table is not None:
+        # 이미 캐시된 컬럼 파일이 있으면 그 행을 순회 (JSON 을 읽지 않음)
+        yield from table
+        return
+
+    # 캐시가 없으면 JSON 을 조금씩 읽으면서 같은 이벤트로 컬럼 값을 쌓고, 끝까지 읽었을 때 캐시에 저장
+    builder = ColumnBuilder()
+    for event in _stream_json(source, chunk_size):
+        builder.add(event)
+        yield event
+    add_cached_file(source, "events", ".npz", lambda path: save_event_store(path, *builder.finish()))
+
+
+def _stream_json(source, chunk_size):
+    if ijson is not None:
+        with open(source, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+        return
+
+    with open(source, 'r', encoding='utf-8') as f:
+        yield from iter_json_array(f, chunk_size)
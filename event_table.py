@@ -0,0 +1,174 @@
+"""
+한 경기의 이벤트를 numpy 컬럼 배열로 보관하는 테이블 모듈
+이벤트 딕셔너리 리스트 대신 사용할 수 있고, 이벤트 하나가 필요할 때만 딕셔너리를 만든다
+
+- EventTable: 컬럼 배열 테이블 (len, 인덱싱, 순회 지원 -> 이벤트 리스트 자리에 그대로 전달 가능)
+- EventRow: 테이블의 한 행을 가리키는 뷰 (처음 접근할 때 이벤트 딕셔너리를 만듦)
+- compact_ids / restore_ids: event id(UUID 문자열)를 32바이트 hex 로 줄이고 되돌림
+"""
+import numpy as np
+
+from event_store import COLUMNS, ingest_events, load_event_store, event_dict
+from parse_cache import cache_enabled
+
+# UUID 문자열로 저장된 컬럼
+ID_COLUMNS = [name for name, dtype in COLUMNS.items() if dtype == "U36"]
+
+
+def compact_ids(ids):
+    """
+    UUID 문자열 배열("U36", 144바이트)을 '-' 를 뺀 hex 바이트 배열("S32", 32바이트)로 변환
+    """
+    return np.char.replace(ids, "-", "").astype("S32")
+
+
+def restore_ids(compact):
+    """
+    compact_ids 로 줄인 id 하나를 UUID 문자열로 되돌림 (빈 값은 '')
+    """
+    if not compact:
+        return ""
+    h = compact.decode("ascii")
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class EventRow:
+    """
+    EventTable 의 한 행을 가리키는 뷰
+    이벤트 딕셔너리처럼 사용할 수 있고(event["type"]["name"], event.get("pass", {}) ...),
+    딕셔너리는 처음 접근할 때 만들어서 뷰가 살아있는 동안만 보관한다
+    """
+    __slots__ = ("table", "row", "_event")
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+        self._event = None
+
+    @property
+    def event(self):
+        if self._event is None:
+            self._event = self.table.event_dict(self.row)
+        return self._event
+
+    def __getitem__(self, key):
+        return self.event[key]
+
+    def __contains__(self, key):
+        return key in self.event
+
+    def __iter__(self):
+        return iter(self.event)
+
+    def __len__(self):
+        return len(self.event)
+
+    def __eq__(self, other):
+        if isinstance(other, EventRow):
+            other = other.event
+        return self.event == other
+
+    def __repr__(self):
+        return f"EventRow({self.row}, {self.event!r})"
+
+    def get(self, key, default=None):
+        return self.event.get(key, default)
+
+    def keys(self):
+        return self.event.keys()
+
+    def values(self):
+        return self.event.values()
+
+    def items(self):
+        return self.event.items()
+
+
+class EventTable:
+    """
+    한 경기의 이벤트를 컬럼 배열로 보관하는 테이블
+    이벤트 리스트를 받는 함수에 그대로 전달할 수 있고 (순회/인덱싱 시 EventRow 반환),
+    event_codes, metric_plan 의 마스크 함수에도 그대로 전달할 수 있다 (columns, names 속성)
+
+    속성:
+    - columns (dict): 컬럼 이름 -> numpy 배열 (id 컬럼은 compact_ids 형태)
+    - names (dict): 테이블 종류 -> {id: 이름}
+    - source (str): 테이블을 만든 이벤트 파일 경로 (from_file 로 만든 경우, match_memo 의 경기 키)
+    """
+
+    def __init__(self, columns, names):
+        self.columns = dict(columns)
+        self.names = names
+        self.source = None
+        for name in ID_COLUMNS:
+            if self.columns[name].dtype.kind == "U":
+                self.columns[name] = compact_ids(self.columns[name])
+
+    @classmethod
+    def from_file(cls, events_file_path, store_path=None):
+        """
+        이벤트 JSON(컬럼 파일이 없거나 오래됐으면 변환) 또는 컬럼 파일(.npz)로 EventTable 생성
+        """
+        source = events_file_path
+        if str(events_file_path).endswith(".npz"):
+            table = cls(*load_event_store(events_file_path))
+        else:
+            try:
+                table = cls(*load_event_store(ingest_events(events_file_path, store_path)))
+            except FileNotFoundError:
+                if store_path is not None or not cache_enabled():
+                    raise
+                # 캐시 폴더의 컬럼 파일을 읽기 전에 다른 프로세스가 LRU 정리로 지운 경우 다시 변환
+                table = cls(*load_event_store(ingest_events(events_file_path, overwrite=True)))
+        table.source = source
+        return table
+
+    def __len__(self):
+        return len(self.columns["type_id"])
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [EventRow(self, i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("EventTable index out of range")
+        return EventRow(self, row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield EventRow(self, row)
+
+    @property
+    def nbytes(self):
+        """
+        컬럼 배열 전체 크기 (바이트)
+        """
+        return sum(array.nbytes for array in self.columns.values())
+
+    def event_id(self, row):
+        """
+        row 번째 이벤트의 event id (UUID 문자열)
+        """
+        return restore_ids(self.columns["id"][row])
+
+    def event_dict(self, row):
+        """
+        row 번째 이벤트를 기존 함수들이 사용하는 이벤트 딕셔너리로 만듦
+        """
+        values = {name: self.columns[name][row].item() for name in COLUMNS}
+        for name in ID_COLUMNS:
+            values[name] = restore_ids(values[name])
+
+        related_ids = None
+        start, end = self.columns["related_offsets"][row:row + 2].tolist()
+        if end > start:
+            related_ids = [self.event_id(i) for i in self.columns["related_index"][start:end].tolist() if i != -1]
+        return event_dict(values, self.names, related_ids)
+
+    def to_events(self):
+        """
+        전체 이벤트를 딕셔너리 리스트로 변환 (여러 번 순회하는 기존 코드에서 속도가 더 중요할 때)
+        """
+        return [self.event_dict(row) for row in range(len(self))]
+
@@ -1,70 +1,70 @@
-import json
+import os
+import sys
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
 import pandas as pd
-from collections import Counter, defaultdict
-
-
-    ## 축구장 그리기
-def draw_soccer_field(ax, side, field_dimen=(120, 80)):
+from collections import Counter
+from tqdm import tqdm
+
+# 상위 폴더의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from event_store import load_events
+from parse_cache import load_lineups
+from event_table import EventTable
+from event_codes import as_event_store
+from metric_plan import match_stats, player_records
+from event_stream import iter_events
+from match_context import as_match_context
+from match_memo import memoize
+from pitch import draw_soccer_field
+from chart_layers import (extract_shots, draw_shot_layer, extract_event_chains, draw_event_chain_layer,
+                          starting_players, pass_network_tables, draw_pass_network_layer)
+
+
+    ###### 경기별 파생 결과 (같은 경기를 다시 그리면 match_memo 의 MEMO 에서 재사용)
+
+@memoize
+def side_lineup(lineup_file_path, side):
         """
-        축구 필드 그리기
+        홈팀 또는 원정팀의 팀 이름과 선발 명단(Starting XI)
 
         매개변수:
-        - ax (matplotlib.axes): 필드를 그릴 matplotlib 축
-        - field_dimen (tuple): 필드의 크기 (길이, 너비)
+        - lineup_file_path (str): 라인업 데이터를 포함한 JSON 파일 경로
+        - side (str): "home" 또는 "away"
 
         반환값:
-        - ax (matplotlib.axes): 축구 필드가 그려진 matplotlib 축
+        - str: 팀 이름
+        - list: 선발 명단 선수 이름
+        """
+        lineup_data = load_lineups(lineup_file_path)
+        lineup_info = lineup_data[0] if side == 'home' else lineup_data[1]
+        return lineup_info["team_name"], starting_players(lineup_info)
+
+
+@memoize
+def pass_tables(events_file_path, team_name, players):
+        """
+        패스 네트워크의 선수 표와 연결 표 (chart_layers.pass_network_tables)
+        """
+        return pass_network_tables(load_events(events_file_path), team_name, players)
+
+
+@memoize
+def shot_table(events_file_path, team_name, on_target_outcomes):
+        """
+        슛 위치와 카테고리 (chart_layers.extract_shots)
         """
-        field_length, field_width = field_dimen
-
-        # 필드 외곽선
-        ax.plot([0, 0, field_length, field_length, 0], [0, field_width, field_width, 0, 0], color="black")
-
-        # 홈/어웨이 진영 배경색 표시
-        if side == 'home':
-            ax.add_patch(
-                plt.Rectangle((0, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-            ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2,
-                                       label="Away Side"))
-        elif side == 'away':
-            ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightblue", alpha=0.2,
-                                       label="Home Side"))
-            ax.add_patch(
-                plt.Rectangle((0, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-
-        # 센터 라인
-        ax.plot([field_length / 2, field_length / 2], [0, field_width], color="black")
-
-        # 센터 서클
-        center_circle = plt.Circle((field_length / 2, field_width / 2), 9.15, color="black", fill=False)
-        ax.add_patch(center_circle)
-        ax.scatter(field_length / 2, field_width / 2, color="black", s=20)  # 센터 스팟
-
-        # 페널티 구역
-        ax.plot([0, 16.5, 16.5, 0], [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-                                     (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-        ax.plot([field_length, field_length - 16.5, field_length - 16.5, field_length],
-                [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-                 (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-
-        # 골키퍼 구역
-        ax.plot([0, 5.5, 5.5, 0], [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-                                   (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-        ax.plot([field_length, field_length - 5.5, field_length - 5.5, field_length],
-                [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-                 (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-
-        # 골대
-        ax.plot([0, -2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-        ax.plot([0, -2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-        ax.plot([field_length, field_length + 2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-        ax.plot([field_length, field_length + 2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-
-        ax.set_xlim(-5, field_length + 5)
-        ax.set_ylim(-5, field_width + 5)
-        ax.set_aspect("equal", adjustable="box")
-        return ax
+        return extract_shots(load_events(events_file_path), team_name, on_target_outcomes)
+
+
+@memoize
+def event_chains(events_file_path, team_name, chain_length):
+        """
+        슛으로 끝나는 이벤트 체인 (chart_layers.extract_event_chains)
+        """
+        return extract_event_chains(as_match_context(events_file_path), team_name, chain_length)
 
 
     ###### passmap
@@ -74,92 +74,30 @@ def draw_pass_network(events_file_path, lineup_file_path, side):
         홈팀 또는 원정팀의 선발 명단(Starting XI)에 대해 패스 네트워크를 시각화
 
         매개변수:
-        - events_file_path (str): 경기 이벤트 데이터를 포함한 JSON 파일 경로
+        - events_file_path (str, EventTable 또는 list): 이벤트 JSON/컬럼 파일(.npz) 경로, EventTable 또는 load_events 로 로드한 이벤트
         - lineup_file_path (str): 라인업 데이터를 포함한 JSON 파일 경로
         - side (str): "home" 또는 "away"를 지정해 특정 팀 선택
 
         반환값:
-        - None: 패스 네트워크 맵을 화면에 출력
+        - matplotlib.figure.Figure: 패스 네트워크 맵 (plt.show 또는 savefig 로 출력)
         """
 
-        # 데이터 로드
-        with open(events_file_path, 'r', encoding='utf-8') as f:
-            events_data = json.load(f)
-        with open(lineup_file_path, 'r', encoding='utf-8') as f:
-            lineup_data = json.load(f)
-
         # 팀과 선발 명단 확인
-        if side == 'home':
-            lineup_info = lineup_data[0]
-        else:
-            side == 'away'
-            lineup_info = lineup_data[1]
+        team_name, players = side_lineup(lineup_file_path, side)
 
-        team_name = lineup_info["team_name"]
-
-        starting_players = []
-        for player in lineup_info['lineup']:
-            if any(position["start_reason"] == "Starting XI" for position in player.get("positions", [])):
-                starting_players.append(player['player_name'])
-
-        # 선택된 팀과 선수의 패스 필터링
-        team_passes = []
-        for event in events_data:
-            if event["type"]["name"] == "Pass" and event["team"]["name"] == team_name:
-                team_passes.append(event)
-
-        # 각 선수의 패스 위치 수집
-        player_positions = defaultdict(list)
-        pass_counter = Counter()
-        for event in team_passes:
-            passer = event["player"]["name"]
-            recipient = event["pass"].get("recipient", {}).get("name")
-            if passer in starting_players:
-                player_positions[passer].append(event["location"])
-            if recipient in starting_players:
-                player_positions[recipient].append(event["pass"]["end_location"])
-            if passer in starting_players and recipient in starting_players:
-                pass_counter[(passer, recipient)] += 1
-
-        # 선수별 평균 위치 계산
-        average_positions = {}
-        for player, positions in player_positions.items():
-            tem1 = []
-            for coord in zip(*positions):
-                tem2 = sum(coord) / len(coord)
-                tem1.append(tem2)
-            average_positions[player] = tem1
-
-        # 각 선수의 총 패스 수 계산 (보낸 패스 + 받은 패스)
-        pass_counts = Counter()
-        for (passer, recipient), count in pass_counter.items():
-            pass_counts[passer] += count
-            pass_counts[recipient] += count
+        # 선수 표(평균 위치, 총 패스 수)와 연결 표(선수 쌍별 패스 수) 계산
+        nodes, edges = pass_tables(events_file_path, team_name, players)
 
         # 축구 필드와 패스 네트워크 그리기
         fig, ax = plt.subplots(figsize=(12, 8))
         ax = draw_soccer_field(ax, side)
-
-        # 패스 연결선 그리기
-        for (passer, recipient), count in pass_counter.items():
-            if passer in average_positions and recipient in average_positions:
-                start_x, start_y = average_positions[passer]
-                end_x, end_y = average_positions[recipient]
-                ax.plot(
-                    [start_x, end_x], [start_y, end_y],
-                    color="blue", linewidth=count / 2, alpha=0.7
-                )
-
-                # 선수 위치와 이름 표시
-        for player, (x, y) in average_positions.items():
-            node_size = pass_counts[player] * 5
-            ax.scatter(x, y, c="red", s=node_size, edgecolor="black", zorder=5)
-            ax.text(x, y + 2, player, fontsize=10, ha="center", zorder=6)
+        draw_pass_network_layer(ax, nodes, edges)
 
         # 최종 그래프 설정
         ax.legend()
         plt.title(f"{team_name} Pass Network (Starting XI)", fontsize=14)
         plt.axis("off")
+        return fig
 
 
     ##### shotmap
@@ -170,87 +108,59 @@ def draw_shot_map(events_file_path, lineup_file_path, side="home"):
         슛을 득점, 유효 슛(막힘, 골대 맞음), 비유효 슛으로 구분
 
         매개변수:
-        - events_file_path (str): 경기 이벤트 데이터를 포함한 JSON 파일 경로
+        - events_file_path (str, EventTable 또는 list): 이벤트 JSON/컬럼 파일(.npz) 경로, EventTable 또는 load_events 로 로드한 이벤트
         - side (str): "home" 또는 "away"를 지정해 특정 팀 선택
 
         반환값:
-        - None: 슛 맵을 화면에 출력
+        - matplotlib.figure.Figure: 슛 맵 (plt.show 또는 savefig 로 출력)
         """
 
-        # 데이터 로드
-        with open(events_file_path, 'r', encoding='utf-8') as f:
-            events_data = json.load(f)
-        with open(lineup_file_path, 'r', encoding='utf-8') as f:
-            lineup_data = json.load(f)
-
-        # 팀과 선발 명단 확인
-        if side == 'home':
-            lineup_info = lineup_data[0]
-        else:
-            side == 'away'
-            lineup_info = lineup_data[1]
-
-        side_team = lineup_info["team_name"]
+        # 팀 확인
+        side_team, _ = side_lineup(lineup_file_path, side)
 
-        team_shots = []
-        for event in events_data:
-            if event["type"]["name"] == "Shot" and event["team"]["name"] == side_team:
-                team_shots.append(event)
-
-        # 슛 위치, 결과, 카테고리 추출
-        shot_locations = []
-        shot_outcomes = []
-        for shot in team_shots:
-            shot_locations.append(shot['location'])
-            shot_outcomes.append(shot['shot']['outcome']['name'])
-
-        shot_categories = []  # 카테고리: "Goal", "On Target", "Off Target"
-        for outcome in shot_outcomes:
-            if outcome == "Goal":
-                shot_categories.append("Goal")
-            elif outcome in ["Saved", "Post", 'Saved Off Target', 'Saved to Post', 'Blocked']:
-                shot_categories.append("On Target")
-            else:
-                shot_categories.append("Off Target")
+        # 슛 위치와 카테고리 추출 (카테고리: "Goal", "On Target", "Off Target")
+        shot_locations, shot_categories = shot_table(events_file_path, side_team,
+                                                     ["Saved", "Post", 'Saved Off Target', 'Saved to Post', 'Blocked'])
 
         # 축구 필드 그리기
         fig, ax = plt.subplots(figsize=(12, 8))
         ax = draw_soccer_field(ax, side)
 
-        # 슛 위치 표시
-        for location, category in zip(shot_locations, shot_categories):
-            x, y = location
-            if category == "Goal":
-                ax.scatter(x, y, c="green", s=100, label="Goal" if "Goal" not in ax.get_legend_handles_labels()[1] else "")
-            elif category == "On Target":
-                ax.scatter(x, y, c="blue", s=100,
-                           label="On Target" if "On Target" not in ax.get_legend_handles_labels()[1] else "")
-            else:
-                ax.scatter(x, y, c="red", s=100,
-                           label="Off Target" if "Off Target" not in ax.get_legend_handles_labels()[1] else "")
+        # 슛 위치 표시 (카테고리별로 한 번에 그림)
+        draw_shot_layer(ax, shot_locations, shot_categories)
 
         # 범례와 제목 추가
         ax.legend()
         plt.title(f"{side_team} Shot Map", fontsize=14)
         plt.axis("off")
+        return fig
 
 
     ######## match table
 
+# 유효슛으로 보는 슛 결과
+ON_TARGET_OUTCOMES = ["Goal", "Saved", "Post", 'Saved Off Target', 'Saved to Post', 'Blocked']
+
+@memoize
 def extract_match_data(events_file_path):
         """
         JSON 데이터를 기반으로 경기 통계를 추출하는 함수
 
         매개변수:
-        - events_file_path (str): JSON 파일 경로
+        - events_file_path (str, EventTable 또는 list): 이벤트 JSON/컬럼 파일(.npz) 경로, EventTable, load_event_store 결과 또는 load_events 로 로드한 이벤트
+          (JSON 경로는 이벤트를 하나씩 읽으므로 전체 파일을 메모리에 올리지 않음,
+           컬럼 파일과 EventTable 은 문자열 비교 없이 정수 코드 마스크로 계산)
 
-        반환값:
+        반환값 (파일 경로, EventTable 이면 MEMO 에 저장되므로 수정하지 말 것):
         - dict: 팀별 경기 통계
         - list: 추출된 팀 이름 리스트
         - dict: 팀별 볼 점유율
         """
-        with open(events_file_path, 'r', encoding='utf-8') as f:
-            events_data = json.load(f)
+        event_store = as_event_store(events_file_path)
+        if event_store is not None:
+            return match_stats(event_store, ON_TARGET_OUTCOMES)
+
+        events_data = iter_events(events_file_path)
 
         teams = {}
         team_names = set()
@@ -288,7 +198,7 @@ def extract_match_data(events_file_path):
             if event_type == "Shot":
                 teams[team_name]["shots"] += 1
                 outcome = event.get("shot", {}).get("outcome", {}).get("name", "")
-                if outcome in ["Goal", "Saved", "Post", 'Saved Off Target', 'Saved to Post', 'Blocked']:
+                if outcome in ON_TARGET_OUTCOMES:
                     teams[team_name]["on_target"] += 1
             elif event_type == "Pass":
                 teams[team_name]["passes"] += 1
@@ -322,7 +232,7 @@ def extract_match_data(events_file_path):
 
 def create_match_table(match_data, team_names, possession_percentages):
         """
-        주어진 경기 데이터를 표로 출력하는 함수
+        주어진 경기 데이터를 표로 출력하는 함수 (matplotlib Figure 반환)
         """
         columns = ["Category", team_names[0], team_names[1]]
         rows = [
@@ -351,24 +261,18 @@ def create_match_table(match_data, team_names, possession_percentages):
         table.auto_set_column_width(col=list(range(len(df.columns))))
         table.scale(1, 1.5)
         plt.title("Match Statistics", fontsize=16, fontweight="bold")
+        return fig
 
 
     ####### most player
 
-def extract_record_data(events_file_path):
+def count_player_records(events_data):
         """
-        JSON 데이터를 기반으로 선수별 데이터를 추출하는 함수
-
-        매개변수:
-        - events_file_path (str): JSON 파일 경로
+        이벤트 딕셔너리를 순회하면서 선수별 'Shot', 'Dribble'(성공), 'Pass'(성공) 수를 세는 함수
 
         반환값:
-        - None: 분야별 Most Player를 표로 출력
-
+        - dict: 선수 이름 -> {'Dribble', 'Shot', 'Pass'}
         """
-        with open(events_file_path, 'r', encoding='utf-8') as f:
-            events_data = json.load(f)
-
         record_count = Counter()
 
         # 이벤트 데이터를 순회하면서 'Shot', 'Dribble', 'Pass' 카운트
@@ -388,8 +292,35 @@ def extract_record_data(events_file_path):
             if player not in player_record:
                 player_record[player] = {'Dribble': 0, 'Shot': 0, 'Pass': 0}
             player_record[player][action] = count
+        return player_record
+
+
+@memoize
+def match_player_records(events_file_path):
+        """
+        선수별 슛, 드리블 성공, 패스 성공 수 (컬럼 배열이면 정수 코드 마스크로 계산)
+        """
+        event_store = as_event_store(events_file_path)
+        if event_store is not None:
+            return player_records(event_store)
+        return count_player_records(load_events(events_file_path))
+
+
+def extract_record_data(events_file_path):
+        """
+        JSON 데이터를 기반으로 선수별 데이터를 추출하는 함수
+
+        매개변수:
+        - events_file_path (str, EventTable 또는 list): 이벤트 JSON/컬럼 파일(.npz) 경로, EventTable, load_event_store 결과 또는 load_events 로 로드한 이벤트
+
+        반환값:
+        - matplotlib.figure.Figure: 분야별 Most Player 표
+
+        """
+        player_record = match_player_records(events_file_path)
 
         player_name = []
+
         dribble_list = []
         shot_list = []
         pass_list = []
@@ -455,140 +386,124 @@ def extract_record_data(events_file_path):
         ax[2].set_title("Most Passer", fontsize=16, fontweight="bold")
 
         plt.tight_layout()
+        return fig
 
 
     ####### event chain
 
-    # '슛' 이벤트를 필터링하는 함수
-
-def find_shot_events(events, team_name):
-        shot_events_id = []
-        shot_category = []
-        for event in (events):
-            if event['type']['name'] == 'Shot' and event['team']['name'] == team_name:
-                # outcome 값을 'shot' 객체 내에서 추출
-                outcome = event.get('shot', {}).get('outcome', {}).get('name')
-                shot_events_id.append(event['id'])
-                shot_category.append(outcome)
-
-        return shot_events_id, shot_category
-
-
-    # 직전 이벤트 추출 함수
-
-def get_locations(events_file_path, shot_events_id, team_name):
-        keypass_id_list = []
-        shot_location = []
-        for shot_id in shot_events_id:
-            for event in events_file_path:
-                if event['id'] == shot_id and 'key_pass_id' in event['shot']:
-                    key_id = event['shot']['key_pass_id']
-                    keypass_id_list.append(key_id)
-                    location = event['location']
-                    shot_location.append(location)
-
-        pass_location = []
-        pass_id_list = []
-        for keypass_id in keypass_id_list:
-            for event in events_file_path:
-                if event['id'] == keypass_id and event['type']['name'] == 'Pass':
-                    location = event['location']
-                    pass_location.append(location)
-                    pass_id_list.append(event['id'])
-
-        pass_location_1 = []
-        for pass_id in pass_id_list:
-            tem = ''
-            for event in events_file_path[::-1]:
-                if event['id'] == pass_id:
-                    tem = team_name
-                    continue
-                if event['type']['name'] == 'Pass' and event['team']['name'] == tem:
-                    location = event['location']
-                    pass_location_1.append(location)
-                    break
-
-        return shot_location, pass_location, pass_location_1
-
-
     # 이벤트 체인의 좌표를 화살표로 연결하고 시각화하는 함수
-def draw_event_chain(events_file_path, lineup_file_path, side):
+def draw_event_chain(events_file_path, lineup_file_path, side, chain_length=3):
         fig, ax = plt.subplots(figsize=(12, 8))
         draw_soccer_field(ax, side)
 
-        with open(lineup_file_path, 'r', encoding='utf-8') as f:
-            lineup_data = json.load(f)
-        with open(events_file_path, 'r', encoding='utf-8') as file:
-            events = json.load(file)
-
-        # 팀과 선발 명단 확인
-        if side == 'home':
-            lineup_info = lineup_data[0]
-        else:
-            side == 'away'
-            lineup_info = lineup_data[1]
+        # 팀 확인
+        team_name, _ = side_lineup(lineup_file_path, side)
 
-        team_name = lineup_info["team_name"]
+        # 슛으로 끝나는 이벤트 체인 (슛, 키패스, 그 전 패스 ... 최대 chain_length 개)
+        # (경기의 인덱스(event id, 팀별 패스 위치)를 한 번 만들어서 체인 추출)
+        chains = event_chains(events_file_path, team_name, chain_length)
 
-        # '슛' 이벤트 중 결과가 골, 포스트, 세이브인 이벤트만 필터링
-        shot_event_id, shot_category = find_shot_events(events, team_name)
-
-        # 필터링된 '슛' 이벤트가 없는 경우
-        if not shot_event_id:
+        # 체인이 없는 경우
+        if not chains:
             print("No shot events found.")
-            return
-
-        # 좌표데이터 추출
-        shot_locations, pass_locations, pass_locations_1 = get_locations(events, shot_event_id, team_name)
-
-        # 직전 이벤트들을 화살표로 연결
-        for shot, _pass, _pass_1, category in zip(shot_locations, pass_locations, pass_locations_1, shot_category):
-            if category in ["Goal", "Saved", "Post", 'Saved Off Target', 'Saved to Post', 'Blocked']:
-                color = 'red'
-                category = 'On Target'
-
-                # 화살표 그리기
-                ax.annotate('', xy=(shot[0], shot[1]),
-                            xytext=(_pass[0], _pass[1]),
-                            arrowprops=dict(arrowstyle="->", color=color, lw=2))
-
-                if _pass[0] >= 60 and _pass_1[0] >= 60:
-                    ax.annotate('', xy=(_pass[0], _pass[1]),
-                                xytext=(_pass_1[0], _pass_1[1]),
-                                arrowprops=dict(arrowstyle="->", color=color, lw=2))
-
-            else:
-                color = 'gray'
-                category = 'Off Target'
-
-                # 화살표 그리기
-                ax.annotate('', xy=(shot[0], shot[1]),
-                            xytext=(_pass[0], _pass[1]),
-                            arrowprops=dict(arrowstyle="->", color=color, lw=2, alpha=0.4))
-
-                if _pass[0] >= 60 and _pass_1[0] >= 60:
-                    ax.annotate('', xy=(_pass[0], _pass[1]),
-                                xytext=(_pass_1[0], _pass_1[1]),
-                                arrowprops=dict(arrowstyle="->", color=color, lw=2, alpha=0.4))
-
-            # 각 이벤트의 점
-            ax.scatter(shot[0], shot[1], color=color, s=1,
-                       label=category if category not in ax.get_legend_handles_labels()[1] else "")
-
-            # 자연수 표시 (번호는 순차적으로 부여)
-            event_number_1 = 1
-            event_number_2 = 2
-            event_number_3 = 3
-            ax.text(shot[0], shot[1], f"{event_number_1}", color='black', fontsize=10, ha='center', va='center', alpha=0.6)
-            ax.text(_pass[0], _pass[1], f"{event_number_2}", color='black', fontsize=10, ha='center', va='center',
-                    alpha=0.6)
-            if _pass[0] >= 60 and _pass_1[0] >= 60:
-                ax.text(_pass_1[0], _pass_1[1], f"{event_number_3}", color='black', fontsize=10, ha='center', va='center',
-                        alpha=0.6)
+            return fig
+
+        # 직전 이벤트들을 화살표로 연결하고 번호 표시
+        draw_event_chain_layer(ax, chains)
 
         plt.title(f"Event Chain for {team_name}")
         plt.axis('off')
         plt.legend(loc='upper right')
+        return fig
+
+
+    ####### batch
+
+# 배치 모드에서 저장하는 차트 이름 (파일 이름에 사용)
+CHARTS = ["pass_network_home", "pass_network_away", "shot_map_home", "shot_map_away",
+          "match_table", "most_player", "event_chain_home", "event_chain_away"]
+
+
+def draw_match_charts(events_file_path, lineup_file_path):
+        """
+        한 경기의 모든 차트를 하나씩 그리는 제너레이터
+        호출한 쪽에서 저장하고 닫은 뒤에 다음 차트를 그리므로 열린 Figure 는 항상 하나
+
+        매개변수:
+        - events_file_path: 이벤트 경로, EventTable 또는 load_events 로 로드한 이벤트
+          (EventTable 이면 경기 기록과 Most Player 를 정수 코드로 계산)
+        - lineup_file_path (str): 라인업 JSON 경로
+
+        반환값:
+        - generator: (차트 이름, matplotlib.figure.Figure)
+        """
+        for side in ("home", "away"):
+            yield f"pass_network_{side}", draw_pass_network(events_file_path, lineup_file_path, side)
+        for side in ("home", "away"):
+            yield f"shot_map_{side}", draw_shot_map(events_file_path, lineup_file_path, side)
+
+        match_data, team_names, possession_percentages = extract_match_data(events_file_path)
+        yield "match_table", create_match_table(match_data, team_names, possession_percentages)
+        yield "most_player", extract_record_data(events_file_path)
+
+        for side in ("home", "away"):
+            yield f"event_chain_{side}", draw_event_chain(events_file_path, lineup_file_path, side)
+
+
+def render_match_report(match_id, events_dir, lineups_dir, output_dir, formats=("png",)):
+        """
+        한 경기의 모든 차트를 파일로 저장하는 함수 (워커 프로세스에서 실행, Agg 백엔드 사용)
+
+        매개변수:
+        - match_id: 경기 id
+        - events_dir, lineups_dir (str): 이벤트/라인업 파일 폴더
+        - output_dir (str): 저장 폴더 ({match_id}_{차트 이름}.{형식})
+        - formats: 저장 형식 리스트 ("png", "svg", "pdf")
+
+        반환값:
+        - list: 저장된 파일 경로
+        - None: 이벤트 또는 라인업 파일이 없는 경우
+        """
+        events_file_path = os.path.join(events_dir, f"{match_id}.json")
+        lineup_file_path = os.path.join(lineups_dir, f"{match_id}.json")
+        if not os.path.exists(events_file_path) or not os.path.exists(lineup_file_path):
+            return None
+
+        # 이벤트는 컬럼 배열 테이블로 한 번만 로드해서 모든 차트에 전달
+        events_data = EventTable.from_file(events_file_path)
+
+        saved_paths = []
+        for chart, fig in draw_match_charts(events_data, lineup_file_path):
+            try:
+                for fmt in formats:
+                    path = os.path.join(output_dir, f"{match_id}_{chart}.{fmt}")
+                    fig.savefig(path, format=fmt)
+                    saved_paths.append(path)
+            finally:
+                # 저장 후 바로 닫아서 차트 수가 늘어도 메모리가 늘지 않게 함
+                plt.close(fig)
+        return saved_paths
+
+
+def render_match_reports(match_ids, events_dir, lineups_dir, output_dir, formats=("png",), jobs=1):
+        """
+        여러 경기의 차트를 jobs 개의 프로세스로 나눠 파일로 저장하는 함수
+
+        반환값:
+        - dict: 경기 id -> 저장된 파일 경로 리스트 (파일이 없는 경기는 None)
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        worker = partial(render_match_report, events_dir=events_dir, lineups_dir=lineups_dir,
+                         output_dir=output_dir, formats=tuple(formats))
+        progress = dict(total=len(match_ids), desc="Rendering matches", unit="match")
+
+        if jobs <= 1:
+            plt.switch_backend("Agg")
+            return dict(zip(match_ids, list(tqdm(map(worker, match_ids), **progress))))
+
+        # 워커 프로세스는 화면 없이 Agg 백엔드로 그림
+        with ProcessPoolExecutor(max_workers=jobs, initializer=plt.switch_backend, initargs=("Agg",)) as executor:
+            return dict(zip(match_ids, list(tqdm(executor.map(worker, match_ids), **progress))))
 
 
     ## 실행
@@ -597,6 +512,31 @@ if __name__ == '__main__':
         events_file_path = "/Users/kyuhyeon/Documents/data/events/3773457.json"
         lineup_file_path = "/Users/kyuhyeon/Documents/data/lineups/3773457.json"
 
+        parser = argparse.ArgumentParser(description="경기 리포트 차트 (패스 네트워크, 슛 맵, 경기 기록, Most Player, 이벤트 체인)")
+        parser.add_argument("--batch", nargs="*", default=None, metavar="MATCH_ID",
+                            help="화면에 띄우지 않고 경기별 차트를 파일로 저장 (경기 id 를 생략하면 이벤트 폴더 전체)")
+        parser.add_argument("--events-dir", default=os.path.dirname(events_file_path), help="이벤트 파일 폴더")
+        parser.add_argument("--lineups-dir", default=os.path.dirname(lineup_file_path), help="라인업 파일 폴더")
+        parser.add_argument("--output-dir", default="match_reports", help="차트 저장 폴더")
+        parser.add_argument("--format", nargs="+", default=["png"], choices=["png", "svg", "pdf"], help="저장 형식")
+        parser.add_argument("--jobs", type=int, default=1, help="워커 프로세스 개수")
+        args = parser.parse_args()
+
+        if args.batch is not None:
+            match_ids = args.batch or sorted(os.path.splitext(f)[0] for f in os.listdir(args.events_dir)
+                                             if f.endswith('.json'))
+            reports = render_match_reports(match_ids, args.events_dir, args.lineups_dir, args.output_dir,
+                                           args.format, args.jobs)
+            for match_id, saved_paths in reports.items():
+                if saved_paths is None:
+                    print(f"Warning: Event or lineup file for match {match_id} not found.")
+            print(f"{sum(len(paths) for paths in reports.values() if paths)}개 차트 저장 완료: {args.output_dir}")
+            sys.exit(0)
+
+        # 이벤트 파일은 컬럼 파일로 한 번만 변환하고, 컬럼 배열 테이블로 한 번만 로드해서 모든 함수에 전달
+        # (이벤트 딕셔너리는 필요할 때 행 단위로 만들고, 경기 기록, Most Player 는 컬럼 배열을 그대로 사용)
+        events_file_path = EventTable.from_file(events_file_path)
+
         ##passmap
         draw_pass_network(events_file_path, lineup_file_path, side = "home")
         draw_pass_network(events_file_path, lineup_file_path, side = "away")
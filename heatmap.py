@@ -1,71 +1,126 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def draw_heatmap(data_imported, team_name, type):
-    # 축구장 크기 (m)
-    field_x = 120  # 가로
-    field_y = 80  # 세로
-
-    # 구간 크기 (가로 12개, 세로 8개)
-    num_bins_x = 12
-    num_bins_y = 8
+from pitch import draw_soccer_field
+
+def location_array(location_data):
+    """
+    (x, y) 위치 리스트 또는 배열을 (N, 2) float 배열로 변환하는 함수
+    """
+    locations = np.asarray(location_data, dtype=float)
+    if locations.size == 0:
+        return np.empty((0, 2))
+    return locations.reshape(-1, 2)
+
+def bin_locations(location_data, num_bins_x=12, num_bins_y=8, field_x=120, field_y=80):
+    """
+    (x, y) 위치 데이터를 축구장 구간별 개수로 변환하는 함수
+    반복문 대신 numpy 로 구간 번호를 계산하고 np.bincount 로 한 번에 카운트
+
+    매개변수:
+    - location_data: (x, y) 위치 리스트 또는 (N, 2) 배열
+    - num_bins_x, num_bins_y: 가로/세로 구간 개수 (해상도)
+    - field_x, field_y: 축구장 크기 (m)
+
+    반환값:
+    - np.ndarray: (num_bins_y, num_bins_x) 구간별 개수
+    """
+    locations = location_array(location_data)
     bin_x = field_x / num_bins_x
     bin_y = field_y / num_bins_y
 
-    # 예시 패스 데이터 (x, y 좌표)
-    passes = data_imported
-
-    # 히트맵을 위한 2D 배열 (패스 개수를 카운트)
-    heatmap = np.zeros((num_bins_y, num_bins_x))
+    # 구간 번호 (경기장 끝 좌표는 마지막 구간에 포함)
+    bin_x_index = np.clip(np.floor_divide(locations[:, 0], bin_x).astype(int), 0, num_bins_x - 1)
+    bin_y_index = np.clip(np.floor_divide(locations[:, 1], bin_y).astype(int), 0, num_bins_y - 1)
+
+    # 2D 구간을 1D 번호로 바꿔서 한 번에 카운트
+    counts = np.bincount(bin_y_index * num_bins_x + bin_x_index, minlength=num_bins_x * num_bins_y)
+    return counts.reshape(num_bins_y, num_bins_x).astype(float)
+
+class HeatmapAccumulator:
+    """
+    위치 좌표를 리스트로 모으지 않고 바로 구간별 개수에 더하는 히트맵 누적기
+    경기 수와 상관없이 메모리 사용량은 구간 개수만큼으로 일정하다
+
+    속성:
+    - resolutions (list): (가로 구간 수, 세로 구간 수) 리스트 (첫 번째가 기본 해상도)
+    - grids (dict): 해상도 -> (세로, 가로) 구간별 개수 배열
+    - count (int): 누적된 위치 개수
+    """
+
+    def __init__(self, resolutions=((12, 8),), field_x=120, field_y=80):
+        self.resolutions = [tuple(resolution) for resolution in resolutions]
+        self.field_x = field_x
+        self.field_y = field_y
+        self.grids = {(num_bins_x, num_bins_y): np.zeros((num_bins_y, num_bins_x))
+                      for num_bins_x, num_bins_y in self.resolutions}
+        self.count = 0
+
+    def add(self, location_data):
+        """
+        (x, y) 위치들을 모든 해상도의 구간별 개수에 더함
+        """
+        locations = location_array(location_data)
+        for num_bins_x, num_bins_y in self.resolutions:
+            self.grids[(num_bins_x, num_bins_y)] += bin_locations(locations, num_bins_x, num_bins_y,
+                                                                  self.field_x, self.field_y)
+        self.count += len(locations)
+        return self
+
+    def merge(self, other):
+        """
+        다른 HeatmapAccumulator 를 합침 (해상도와 축구장 크기가 같아야 함)
+        """
+        if self.resolutions != other.resolutions or (self.field_x, self.field_y) != (other.field_x, other.field_y):
+            raise ValueError("해상도나 축구장 크기가 다른 히트맵은 합칠 수 없습니다")
+        for resolution in self.resolutions:
+            self.grids[resolution] += other.grids[resolution]
+        self.count += other.count
+        return self
+
+    def grid(self, num_bins_x=None, num_bins_y=None):
+        """
+        해상도별 구간별 개수 (지정하지 않으면 기본 해상도)
+        """
+        if num_bins_x is None:
+            return self.grids[self.resolutions[0]]
+        return self.grids[(num_bins_x, num_bins_y)]
+
+def as_heatmap(data_imported, num_bins_x=12, num_bins_y=8, field_x=120, field_y=80, is_grid=None):
+    """
+    이미 구간별 개수로 합쳐진 히트맵(2D 배열, HeatmapAccumulator)이면 그대로, 위치 데이터면 bin_locations 로 변환하는 함수
+
+    매개변수:
+    - is_grid (bool): True 이면 구간별 개수, False 이면 위치 데이터로 처리
+      (None 이면 (num_bins_y, num_bins_x) 모양의 배열과 열이 2개가 아닌 2D 배열만 구간별 개수로 봄,
+      가로 구간이 2개인 히트맵도 모양이 맞으면 위치 데이터로 착각하지 않음)
+
+    반환값:
+    - np.ndarray: 구간별 개수
+    """
+    if isinstance(data_imported, HeatmapAccumulator):
+        return data_imported.grid()
+    if is_grid is None:
+        is_grid = (isinstance(data_imported, np.ndarray) and data_imported.ndim == 2
+                   and (data_imported.shape == (num_bins_y, num_bins_x) or data_imported.shape[1] != 2))
+    if is_grid:
+        return np.asarray(data_imported, dtype=float)
+    return bin_locations(data_imported, num_bins_x, num_bins_y, field_x, field_y)
+
+def draw_heatmap(data_imported, team_name, type, num_bins_x=12, num_bins_y=8):
+    # 축구장 크기 (m)
+    field_x = 120  # 가로
+    field_y = 80  # 세로
 
-    # 패스를 각 구간에 분류하고 개수 카운트
-    for x, y in passes:
-        # 가로 (x) 위치
-        bin_x_index = min(int(x // bin_x), num_bins_x - 1)
-        
-        # 세로 (y) 위치
-        bin_y_index = min(int(y // bin_y), num_bins_y - 1)
-        
-        # 해당 구간의 패스 개수 증가
-        heatmap[bin_y_index, bin_x_index] += 1
+    # 패스를 각 구간에 분류하고 개수 카운트 (기본 가로 12개, 세로 8개)
+    # 이미 구간별 개수로 합쳐진 히트맵이면 그대로 사용
+    heatmap = as_heatmap(data_imported, num_bins_x, num_bins_y, field_x, field_y)
 
     # 축구장 그림 그리기
     fig, ax = plt.subplots(figsize=(12, 8))
 
-    # 축구장 외곽선
-    ax.plot([0, 0, field_x, field_x, 0], [0, field_y, field_y, 0, 0], color="black")
-
-    # 센터 라인
-    ax.plot([field_x / 2, field_x / 2], [0, field_y], color="black")
-
-    # 센터 서클
-    center_circle = plt.Circle((field_x / 2, field_y / 2), 9.15, color="black", fill=False)
-    ax.add_patch(center_circle)
-    ax.scatter(field_x / 2, field_y / 2, color="black", s=20)  # 센터 스팟
-
-    # 페널티 구역
-    ax.plot([0, 16.5, 16.5, 0], [(field_y - 40.3) / 2, (field_y - 40.3) / 2,
-                                (field_y + 40.3) / 2, (field_y + 40.3) / 2], color="black")
-    ax.plot([field_x, field_x - 16.5, field_x - 16.5, field_x],
-            [(field_y - 40.3) / 2, (field_y - 40.3) / 2,
-            (field_y + 40.3) / 2, (field_y + 40.3) / 2], color="black")
-
-    # 골키퍼 구역
-    ax.plot([0, 5.5, 5.5, 0], [(field_y - 18.32) / 2, (field_y - 18.32) / 2,
-                                (field_y + 18.32) / 2, (field_y + 18.32) / 2], color="black")
-    ax.plot([field_x, field_x - 5.5, field_x - 5.5, field_x],
-            [(field_y - 18.32) / 2, (field_y - 18.32) / 2,
-            (field_y + 18.32) / 2, (field_y + 18.32) / 2], color="black")
-
-    # 골대
-    ax.plot([0, -2], [(field_y - 7.32) / 2, (field_y - 7.32) / 2], color="black")
-    ax.plot([0, -2], [(field_y + 7.32) / 2, (field_y + 7.32) / 2], color="black")
-    ax.plot([field_x, field_x + 2], [(field_y - 7.32) / 2, (field_y - 7.32) / 2], color="black")
-    ax.plot([field_x, field_x + 2], [(field_y + 7.32) / 2, (field_y + 7.32) / 2], color="black")
-
-    ax.set_xlim(-5, field_x + 5)
-    ax.set_ylim(-5, field_y + 5)
-    ax.set_aspect("equal", adjustable="box")
+    # 축구장 그리기 (라인 좌표는 캐시된 것을 사용)
+    draw_soccer_field(ax, None, (field_x, field_y))
 
     # 히트맵 시각화
     # 히트맵을 축구장 위에 투명하게 덧붙이기
@@ -0,0 +1,206 @@
+"""
+StatsBomb open-data 를 압축을 풀지 않고 zip 또는 tar(.tar, .tar.gz, .tar.bz2, .tar.xz) 파일에서 바로 읽는 모듈
+작은 JSON 수만 개를 폴더에서 하나씩 찾고 여는 대신, 압축 파일 하나를 열어두고 멤버 인덱스로 필요한 파일만 읽는다
+
+- MatchArchive: 압축 파일 하나 (멤버 인덱스는 처음 한 번 만들어서 parse_cache 폴더에 저장)
+- open_archive: 프로세스마다 같은 압축 파일을 한 번만 여는 함수 (워커 프로세스에서 사용)
+
+멤버 이름은 경로에서 마지막 종류 폴더(events, lineups, matches) 다음 부분으로 찾는다
+- open-data-master/data/events/3773457.json -> ("events", "3773457.json")
+- open-data-master/data/matches/11/90.json -> ("matches", "11/90.json")
+"""
+import os
+import json
+import pickle
+import tarfile
+import zipfile
+
+from event_store import events_to_columns, save_event_store
+from event_table import EventTable
+from parse_cache import cache_enabled, load_cached, load_pickle
+
+# 인덱스에 넣는 폴더 종류
+KINDS = ("events", "lineups", "matches")
+
+# 프로세스별로 열어둔 압축 파일
+_OPEN_ARCHIVES = {}
+
+
+def open_archive(archive_path):
+    """
+    압축 파일을 MatchArchive 로 여는 함수 (같은 프로세스에서는 한 번만 열고 인덱스도 한 번만 읽음)
+    """
+    archive_path = os.path.abspath(archive_path)
+    if archive_path not in _OPEN_ARCHIVES:
+        _OPEN_ARCHIVES[archive_path] = MatchArchive(archive_path)
+    return _OPEN_ARCHIVES[archive_path]
+
+
+def member_kind(member_name):
+    """
+    멤버 경로를 (종류, 종류 폴더 안의 이름) 으로 나눔 (종류 폴더가 없으면 None)
+    """
+    parts = member_name.replace("\\", "/").split("/")
+    for i in range(len(parts) - 2, -1, -1):
+        if parts[i] in KINDS:
+            return parts[i], "/".join(parts[i + 1:])
+    return None
+
+
+class MatchArchive:
+    """
+    open-data 압축 파일 하나
+
+    속성:
+    - path (str): 압축 파일 경로
+    - index (dict): 종류 -> {이름: 위치} (zip 은 (헤더 위치, 멤버 이름), tar 는 (데이터 시작 위치, 크기))
+    - sizes (dict): 종류 -> {이름: 파일 크기}
+    """
+
+    def __init__(self, archive_path):
+        self.path = os.path.abspath(archive_path)
+        self.is_zip = zipfile.is_zipfile(self.path)
+        self.mtime = os.stat(self.path).st_mtime
+        self.index, self.sizes = self._load_index()
+        self._handle = None
+        self._handle_pid = None
+
+    def __reduce__(self):
+        # 워커 프로세스에는 경로만 보내고, 워커에서 open_archive 로 한 번 열어서 재사용
+        return open_archive, (self.path,)
+
+    def _build_index(self):
+        index = {kind: {} for kind in KINDS}
+        sizes = {kind: {} for kind in KINDS}
+        if self.is_zip:
+            with zipfile.ZipFile(self.path) as archive:
+                members = [(info.filename, (info.header_offset, info.filename), info.file_size) for info in archive.infolist()
+                           if not info.is_dir()]
+        else:
+            # tar 는 멤버 헤더를 처음부터 끝까지 읽어야 하므로 (gzip 이면 전부 풀어야 함) 결과를 캐시해서 한 번만 만듦
+            with tarfile.open(self.path, "r:*") as archive:
+                members = [(info.name, (info.offset_data, info.size), info.size) for info in archive
+                           if info.isfile()]
+
+        for member_name, location, size in members:
+            kind_name = member_kind(member_name)
+            if kind_name is not None:
+                kind, name = kind_name
+                index[kind][name] = location
+                sizes[kind][name] = size
+        return index, sizes
+
+    def _load_index(self):
+        if not cache_enabled():
+            return self._build_index()
+
+        def build(path):
+            with open(path, 'wb') as f:
+                pickle.dump(self._build_index(), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return load_cached(self.path, "archives", ".pkl", build, load_pickle)
+
+    def _open(self):
+        # fork 로 만든 워커 프로세스는 부모가 연 핸들(같은 파일 위치)을 물려받으므로 프로세스마다 다시 엶
+        if self._handle is not None and self._handle_pid != os.getpid():
+            self._handle = None
+        if self._handle is None:
+            self._handle_pid = os.getpid()
+            if self.is_zip:
+                self._handle = zipfile.ZipFile(self.path)
+            else:
+                # 압축된 tar 의 fileobj 는 풀린 내용 기준으로 seek 할 수 있음 (앞으로 읽을 때 가장 빠름)
+                self._handle = tarfile.open(self.path, "r:*")
+        return self._handle
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def names(self, kind, prefix=""):
+        """
+        종류 폴더 안의 멤버 이름 리스트 (압축 파일 안의 순서)
+        """
+        return [name for name in self.index[kind] if name.startswith(prefix)]
+
+    def contains(self, kind, name):
+        return name in self.index[kind]
+
+    def member_info(self, kind, name):
+        """
+        멤버의 (표시용 경로, 크기, 수정 시간) (멤버가 없으면 크기와 수정 시간이 None)
+        수정 시간은 압축 파일의 수정 시간을 사용
+        """
+        label = f"{self.path}!{kind}/{name}"
+        if name not in self.index[kind]:
+            return label, None, None
+        return label, self.sizes[kind][name], self.mtime
+
+    def read(self, kind, name):
+        """
+        멤버 내용을 bytes 로 읽는 함수
+
+        반환값:
+        - bytes: 멤버 내용
+        - None: 멤버가 없는 경우
+        """
+        location = self.index[kind].get(name)
+        if location is None:
+            return None
+        handle = self._open()
+        if self.is_zip:
+            return handle.read(location[1])
+        offset, size = location
+        handle.fileobj.seek(offset)
+        return handle.fileobj.read(size)
+
+    def read_json(self, kind, name):
+        """
+        멤버 JSON 을 디코딩하는 함수 (멤버가 없으면 None)
+        """
+        data = self.read(kind, name)
+        return None if data is None else json.loads(data)
+
+    def sort_match_results(self, match_results):
+        """
+        경기 목록을 압축 파일 안의 이벤트 위치 순서로 정렬 (이벤트가 없는 경기는 맨 뒤)
+        앞으로만 읽게 되므로 압축된 tar 를 처음부터 다시 풀지 않고, 네트워크 파일 시스템에서도 순차 읽기가 됨
+        """
+        def position(match_result):
+            location = self.index["events"].get(f"{match_result['match_id']}.json")
+            return (location is None, location[0] if location is not None else 0)
+
+        return sorted(match_results, key=position)
+
+    def lineups(self, match_id):
+        """
+        경기의 라인업 데이터 (없으면 None)
+        """
+        return self.read_json("lineups", f"{match_id}.json")
+
+    def events(self, match_id):
+        """
+        경기의 이벤트 리스트 (없으면 None)
+        """
+        return self.read_json("events", f"{match_id}.json")
+
+    def event_table(self, match_id):
+        """
+        경기의 이벤트를 EventTable 로 로드 (컬럼 파일은 parse_cache 폴더에 캐시)
+
+        반환값:
+        - EventTable: 이벤트 테이블
+        - None: 이벤트 멤버가 없는 경우
+        """
+        name = f"{match_id}.json"
+        if not self.contains("events", name):
+            return None
+        if not cache_enabled():
+            return EventTable(*events_to_columns(self.events(match_id)))
+
+        def build(path):
+            save_event_store(path, *events_to_columns(self.events(match_id)))
+
+        # 캐시 키는 압축 파일(경로, 크기, 수정 시간)과 멤버 이름
+        return load_cached(self.path, "events", ".npz", build, EventTable.from_file, member=f"events/{name}")
@@ -0,0 +1,180 @@
+"""
+한 경기의 이벤트/라인업 데이터를 한 번만 로드해서 여러 추출 함수가 함께 사용하도록 하는 모듈
+
+- MatchContext: 경기별 이벤트, 라인업, 파생 인덱스(타입별 이벤트, event id 위치, 팀별 패스 위치) 보관
+- RelatedEventsGraph: event id -> 팀, related_events 연결 인덱스
+- as_match_context: 이벤트 리스트/경로를 MatchContext 로 변환
+"""
+import os
+from bisect import bisect_left
+from collections import defaultdict
+
+from event_store import load_events
+from parse_cache import load_lineups
+
+
+class MatchContext:
+    """
+    한 경기의 데이터를 보관하는 클래스
+    이벤트 파일은 생성할 때 한 번만 디코딩하고, 파생 인덱스는 처음 사용할 때 만든다
+
+    속성:
+    - match_id: 경기 id
+    - events (list): 이벤트 리스트
+    - lineups (list): 라인업 데이터 (없으면 None)
+    - home_team, away_team (str): 홈/어웨이 팀 이름 (첫 두 이벤트인 Starting XI 기준)
+    """
+
+    def __init__(self, match_id, events_data, lineup_data=None):
+        self.match_id = match_id
+        self.events = events_data
+        self.lineups = lineup_data
+        self.home_team = events_data[0]['team']['name']
+        self.away_team = events_data[1]['team']['name']
+        self._events_by_type = None
+        self._event_positions = None
+        self._team_pass_positions = None
+        self._related_graph = None
+
+    @classmethod
+    def from_files(cls, events_file_path, lineup_file_path=None, match_id=None):
+        """
+        이벤트(.json/.npz), 라인업 파일 경로로 MatchContext 생성
+        """
+        if match_id is None:
+            match_id = os.path.splitext(os.path.basename(str(events_file_path)))[0]
+
+        lineup_data = None
+        if lineup_file_path is not None:
+            lineup_data = load_lineups(lineup_file_path)
+
+        return cls(match_id, load_events(events_file_path), lineup_data)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+    def team_name(self, side):
+        """
+        "home" 또는 "away" 에 해당하는 팀 이름
+        """
+        if side.lower() == 'home':
+            return self.home_team
+        return self.away_team
+
+    @property
+    def events_by_type(self):
+        """
+        이벤트 타입 이름 -> 이벤트 리스트 인덱스
+        """
+        if self._events_by_type is None:
+            self._events_by_type = defaultdict(list)
+            for event in self.events:
+                self._events_by_type[event["type"]["name"]].append(event)
+        return self._events_by_type
+
+    def team_events(self, type_name, team_name):
+        """
+        특정 팀의 특정 타입 이벤트 리스트
+        """
+        return [event for event in self.events_by_type.get(type_name, []) if event["team"]["name"] == team_name]
+
+    @property
+    def event_positions(self):
+        """
+        event id -> 이벤트 리스트 위치 인덱스
+        """
+        if self._event_positions is None:
+            self._event_positions = {event["id"]: position for position, event in enumerate(self.events)}
+        return self._event_positions
+
+    def event(self, event_id):
+        """
+        event id 에 해당하는 이벤트 (없으면 None)
+        """
+        position = self.event_positions.get(event_id)
+        if position is None:
+            return None
+        return self.events[position]
+
+    def team_pass_positions(self, team_name):
+        """
+        특정 팀의 패스 이벤트 위치 리스트 (오름차순)
+        """
+        if self._team_pass_positions is None:
+            self._team_pass_positions = defaultdict(list)
+            for position, event in enumerate(self.events):
+                if event["type"]["name"] == "Pass":
+                    self._team_pass_positions[event["team"]["name"]].append(position)
+        return self._team_pass_positions.get(team_name, [])
+
+    def previous_team_pass(self, event_id, team_name):
+        """
+        event id 이벤트 바로 전에 나온 특정 팀의 패스 이벤트 (없으면 None)
+        """
+        position = self.event_positions.get(event_id)
+        if position is None:
+            return None
+        positions = self.team_pass_positions(team_name)
+        i = bisect_left(positions, position)
+        if i == 0:
+            return None
+        return self.events[positions[i - 1]]
+
+    @property
+    def related_graph(self):
+        """
+        related_events 연결 인덱스 (RelatedEventsGraph)
+        """
+        if self._related_graph is None:
+            self._related_graph = RelatedEventsGraph(self.events)
+        return self._related_graph
+
+
+class RelatedEventsGraph:
+    """
+    이벤트끼리의 related_events 연결을 조회하는 인덱스
+    드리블 실패, 듀얼, 리커버리처럼 "상대 팀 이벤트와 연결된 이벤트"를 찾는 데 사용
+
+    속성:
+    - team_by_id (dict): event id -> 팀 이름 (팀이 없는 이벤트는 None)
+    - adjacency (dict): event id -> 연결된 event id 리스트 (경기에 있는 이벤트만)
+    """
+
+    def __init__(self, events_data):
+        self.team_by_id = {event['id']: event.get('team', {}).get('name') for event in events_data}
+        self.adjacency = {}
+        for event in events_data:
+            related_ids = [related_id for related_id in event.get('related_events', []) if related_id in self.team_by_id]
+            if related_ids:
+                self.adjacency[event['id']] = related_ids
+
+    def related(self, event_id):
+        """
+        연결된 event id 리스트
+        """
+        return self.adjacency.get(event_id, [])
+
+    def related_teams(self, event_id):
+        """
+        연결된 이벤트들의 팀 이름 집합
+        """
+        return {self.team_by_id[related_id] for related_id in self.related(event_id)}
+
+    def linked_to_opponent(self, event_id, team_name):
+        """
+        team_name 이 아닌 팀(또는 팀이 없는) 이벤트와 연결되어 있는지 여부
+        """
+        return any(self.team_by_id[related_id] != team_name for related_id in self.related(event_id))
+
+
+def as_match_context(events):
+    """
+    MatchContext, 이벤트 리스트 또는 이벤트 파일 경로(.json/.npz)를 MatchContext 로 변환
+    (이미 MatchContext 이면 그대로 반환해서 인덱스를 다시 만들지 않음)
+    """
+    if isinstance(events, MatchContext):
+        return events
+    return MatchContext(None, load_events(events))
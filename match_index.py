@@ -0,0 +1,271 @@
+"""
+시즌별 matches JSON 폴더(Laliga_10_21 등) 또는 open-data 압축 파일의 경기 정보를 SQLite 인덱스로 저장하는 모듈
+
+- season_files: 폴더 또는 압축 파일의 시즌 파일 목록
+- build_match_index: 바뀐 시즌 파일만 다시 읽어서 인덱스 갱신
+- select_match_results: 승/패(또는 무승부) 경기 목록 조회
+- select_team_matches: 특정 팀의 경기 id 와 홈/어웨이 조회
+- select_team_records: 팀별 경기 수, 승리 수 조회
+"""
+import os
+import json
+import sqlite3
+import argparse
+from functools import partial
+
+from match_archive import MatchArchive, open_archive
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS season_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime REAL
+);
+CREATE TABLE IF NOT EXISTS matches (
+    match_id INTEGER PRIMARY KEY,
+    season_file TEXT,
+    position INTEGER,
+    competition TEXT,
+    season TEXT,
+    home_team_id INTEGER,
+    home_team TEXT,
+    away_team_id INTEGER,
+    away_team TEXT,
+    home_score INTEGER,
+    away_score INTEGER,
+    result TEXT,
+    events_path TEXT,
+    events_size INTEGER,
+    events_mtime REAL
+);
+CREATE INDEX IF NOT EXISTS idx_matches_result ON matches(result);
+CREATE INDEX IF NOT EXISTS idx_matches_home_team ON matches(home_team);
+CREATE INDEX IF NOT EXISTS idx_matches_away_team ON matches(away_team);
+CREATE INDEX IF NOT EXISTS idx_matches_season_file ON matches(season_file, position);
+"""
+
+DEFAULT_DB_NAME = "match_index.sqlite"
+
+
+def match_result(home_score, away_score):
+    """
+    점수로 경기 결과를 구함 ('Home', 'Away', 'Draw': 이긴 쪽)
+    """
+    if home_score > away_score:
+        return 'Home'
+    elif away_score > home_score:
+        return 'Away'
+    return 'Draw'
+
+
+def events_file_info(match_id, events_dir):
+    """
+    경기 이벤트 파일의 (경로, 크기, 수정 시간) (파일이 없으면 크기와 수정 시간이 None, events_dir 가 없으면 모두 None)
+    """
+    if isinstance(events_dir, MatchArchive):
+        return events_dir.member_info("events", f"{match_id}.json")
+    if events_dir is None:
+        return None, None, None
+    events_path = os.path.join(events_dir, f"{match_id}.json")
+    if not os.path.exists(events_path):
+        return events_path, None, None
+    stat = os.stat(events_path)
+    return events_path, stat.st_size, stat.st_mtime
+
+
+def match_row(match, season_file, position, events_dir):
+    """
+    matches JSON 의 경기 하나를 인덱스 행으로 변환
+    """
+    events_path, events_size, events_mtime = events_file_info(match['match_id'], events_dir)
+
+    return (
+        match['match_id'],
+        season_file,
+        position,
+        match.get('competition', {}).get('competition_name'),
+        match.get('season', {}).get('season_name'),
+        match['home_team'].get('home_team_id'),
+        match['home_team'].get('home_team_name'),
+        match['away_team'].get('away_team_id'),
+        match['away_team'].get('away_team_name'),
+        match['home_score'],
+        match['away_score'],
+        match_result(match['home_score'], match['away_score']),
+        events_path,
+        events_size,
+        events_mtime,
+    )
+
+
+def load_json(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def season_files(matches_dir, prefix=""):
+    """
+    시즌 파일 목록 (폴더 또는 open-data 압축 파일)
+
+    반환값:
+    - list: (경로, 크기, 수정 시간, JSON 로드 함수) 튜플 리스트
+    """
+    if isinstance(matches_dir, MatchArchive):
+        files = []
+        for name in sorted(matches_dir.names("matches", prefix)):
+            if name.endswith('.json'):
+                file_path, size, mtime = matches_dir.member_info("matches", name)
+                files.append((file_path, size, mtime, partial(matches_dir.read_json, "matches", name)))
+        return files
+
+    files = []
+    for filename in sorted(os.listdir(matches_dir)):
+        if not filename.endswith('.json'):
+            continue
+        file_path = os.path.join(matches_dir, filename)
+        stat = os.stat(file_path)
+        files.append((file_path, stat.st_size, stat.st_mtime, partial(load_json, file_path)))
+    return files
+
+
+def build_match_index(matches_dir, events_dir=None, db_path=None, prefix=""):
+    """
+    matches 폴더의 경기 정보를 SQLite 인덱스로 만들거나 갱신하는 함수
+    크기나 수정 시간이 바뀐 시즌 파일만 다시 읽는다
+
+    매개변수:
+    - matches_dir (str 또는 MatchArchive): 시즌별 matches JSON 폴더 또는 open-data 압축 파일
+    - events_dir (str 또는 MatchArchive): 이벤트 파일 폴더 또는 압축 파일 (경로, 크기, 수정 시간 기록용, 없으면 생략)
+    - db_path (str): 인덱스 파일 경로 (없으면 matches 폴더 안의 match_index.sqlite, 압축 파일이면 압축 파일 옆)
+    - prefix (str): 압축 파일의 matches 폴더 안에서 읽을 시즌 파일 접두어 (예: "11/" -> 라리가)
+
+    반환값:
+    - sqlite3.Connection: 인덱스 연결
+    """
+    if db_path is None:
+        if isinstance(matches_dir, MatchArchive):
+            db_path = f"{matches_dir.path}.{DEFAULT_DB_NAME}"
+        else:
+            db_path = os.path.join(matches_dir, DEFAULT_DB_NAME)
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+
+    indexed = {row['path']: (row['size'], row['mtime']) for row in conn.execute("SELECT * FROM season_files")}
+    current = set()
+
+    with conn:
+        for file_path, size, mtime, load in season_files(matches_dir, prefix):
+            current.add(file_path)
+
+            # 바뀌지 않은 시즌 파일은 건너뜀
+            if indexed.get(file_path) == (size, mtime):
+                continue
+
+            data = load()
+
+            conn.execute("DELETE FROM matches WHERE season_file = ?", (file_path,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [match_row(match, file_path, position, events_dir) for position, match in enumerate(data)])
+            conn.execute("INSERT OR REPLACE INTO season_files VALUES (?, ?, ?)",
+                         (file_path, size, mtime))
+
+        # 이벤트 파일은 시즌 파일과 따로 추가/수정되므로 events_dir 가 있으면 매번 다시 확인
+        # (events_dir 없이 만든 인덱스의 빈 값도 여기서 채워짐)
+        if events_dir is not None:
+            rows = conn.execute("SELECT match_id, events_path, events_size, events_mtime FROM matches").fetchall()
+            updates = []
+            for row in rows:
+                info = events_file_info(row['match_id'], events_dir)
+                if info != (row['events_path'], row['events_size'], row['events_mtime']):
+                    updates.append(info + (row['match_id'],))
+            conn.executemany("UPDATE matches SET events_path = ?, events_size = ?, events_mtime = ? WHERE match_id = ?",
+                             updates)
+
+        # 폴더에서 사라진 시즌 파일 정리
+        for file_path in set(indexed) - current:
+            conn.execute("DELETE FROM matches WHERE season_file = ?", (file_path,))
+            conn.execute("DELETE FROM season_files WHERE path = ?", (file_path,))
+
+    return conn
+
+
+def select_match_results(conn, include_draws=False):
+    """
+    경기 결과 목록을 조회하는 함수
+
+    매개변수:
+    - conn: build_match_index 로 만든 인덱스 연결
+    - include_draws (bool): 무승부 경기 포함 여부 (포함하면 winner, loser 가 'Draw')
+
+    반환값:
+    - list: {'match_id', 'winner', 'loser'} 딕셔너리 리스트 ('Home' 또는 'Away')
+    """
+    query = "SELECT match_id, result FROM matches"
+    if not include_draws:
+        query += " WHERE result != 'Draw'"
+    query += " ORDER BY season_file, position"
+
+    match_results = []
+    for row in conn.execute(query):
+        if row['result'] == 'Home':
+            winner, loser = 'Home', 'Away'
+        elif row['result'] == 'Away':
+            winner, loser = 'Away', 'Home'
+        else:
+            winner, loser = 'Draw', 'Draw'
+        match_results.append({'match_id': row['match_id'], 'winner': winner, 'loser': loser})
+    return match_results
+
+
+def select_team_matches(conn, team_name):
+    """
+    특정 팀의 경기 id 와 홈/어웨이 목록
+
+    반환값:
+    - list: (match_id, 'home' 또는 'away') 튜플 리스트
+    """
+    query = """
+        SELECT match_id, CASE WHEN home_team = :team THEN 'home' ELSE 'away' END AS side
+        FROM matches
+        WHERE home_team = :team OR away_team = :team
+        ORDER BY season_file, position
+    """
+    return [(row['match_id'], row['side']) for row in conn.execute(query, {'team': team_name})]
+
+
+def select_team_records(conn):
+    """
+    팀별 경기 수와 승리 수
+
+    반환값:
+    - dict: 팀 이름 -> {'matches': 경기 수, 'wins': 승리 수}
+    """
+    query = """
+        SELECT team, COUNT(*) AS matches, SUM(win) AS wins FROM (
+            SELECT home_team AS team, result = 'Home' AS win FROM matches
+            UNION ALL
+            SELECT away_team AS team, result = 'Away' AS win FROM matches
+        )
+        GROUP BY team
+    """
+    return {row['team']: {'matches': row['matches'], 'wins': row['wins']} for row in conn.execute(query)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="matches 폴더의 경기 정보 인덱스 생성/갱신")
+    parser.add_argument("matches_dir", help="시즌별 matches JSON 폴더 (--archive 이면 압축 파일 안의 시즌 파일 접두어)")
+    parser.add_argument("--events-dir", default=None, help="이벤트 파일 폴더")
+    parser.add_argument("--archive", default=None, help="open-data zip/tar 압축 파일 (matches, events 를 압축 파일에서 읽음)")
+    parser.add_argument("--db", default=None, help="인덱스 파일 경로")
+    args = parser.parse_args()
+
+    if args.archive is not None:
+        archive = open_archive(args.archive)
+        conn = build_match_index(archive, archive, args.db, prefix=args.matches_dir)
+    else:
+        conn = build_match_index(args.matches_dir, args.events_dir, args.db)
+    for result, count in conn.execute("SELECT result, COUNT(*) FROM matches GROUP BY result"):
+        print(f"{result}: {count}")
@@ -0,0 +1,113 @@
+"""
+한 프로세스 안에서 경기별 파생 결과(선발 명단, 팀 이름, 패스/슛 표, 점유율 ...)를 재사용하는 메모리 LRU 캐시 모듈
+키는 (경기 키, 함수 이름, 인자) 이고, 경기 키는 파일 경로와 크기, 수정 시간이므로 파일이 바뀌면 다시 계산한다
+노트북에서 같은 경기를 여러 번 그려도 두 번째 호출부터는 계산 없이 결과를 돌려준다
+
+- LRUMemo: 크기 제한과 hit/miss 카운터가 있는 LRU 캐시
+- MEMO: 기본 캐시 (크기는 환경 변수 MATCH_MEMO_SIZE, 기본 256)
+- match_key: 경기 파일 경로 또는 EventTable 의 경기 키 (키를 만들 수 없으면 None)
+- memoize: 첫 번째 인자를 경기로 보고 결과를 MEMO 에 저장하는 데코레이터
+"""
+import os
+import functools
+from collections import OrderedDict
+
+DEFAULT_MEMO_SIZE = 256
+
+
+class LRUMemo:
+    """
+    크기 제한이 있는 LRU 캐시 (가장 오래 사용하지 않은 결과부터 버림)
+
+    속성:
+    - maxsize (int): 최대 결과 개수
+    - hits, misses (int): 캐시 사용 / 새로 계산한 횟수
+    """
+
+    def __init__(self, maxsize=DEFAULT_MEMO_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def get(self, key, compute):
+        """
+        key 의 결과를 반환하는 함수 (없으면 compute() 로 계산해서 저장)
+        """
+        if key in self._results:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        self.misses += 1
+        result = compute()
+        self._results[key] = result
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+        return result
+
+    def info(self):
+        """
+        캐시 사용 현황
+
+        반환값:
+        - dict: hits, misses, size, maxsize
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._results), "maxsize": self.maxsize}
+
+    def clear(self):
+        """
+        저장된 결과와 카운터 초기화
+        """
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+
+MEMO = LRUMemo(int(os.environ.get("MATCH_MEMO_SIZE", DEFAULT_MEMO_SIZE)))
+
+
+def match_key(source):
+    """
+    경기 파일 경로(또는 파일로 만든 EventTable)의 경기 키
+
+    반환값:
+    - tuple: (절대 경로, 크기, 수정 시간)
+    - None: 이미 로드된 이벤트 리스트처럼 파일을 알 수 없는 경우 (캐시하지 않음)
+    """
+    source = getattr(source, "source", source)
+    if not isinstance(source, (str, os.PathLike)):
+        return None
+    stat = os.stat(source)
+    return os.path.abspath(source), stat.st_size, stat.st_mtime_ns
+
+
+def _freeze(value):
+    # 리스트, 딕셔너리 인자를 키로 쓸 수 있게 튜플로 변환
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def memoize(function):
+    """
+    첫 번째 인자(경기 파일 경로 또는 EventTable)와 나머지 인자가 같으면 MEMO 의 결과를 반환하는 데코레이터
+    반환값은 여러 호출이 공유하므로 호출한 쪽에서 수정하지 않아야 한다
+    """
+    @functools.wraps(function)
+    def wrapper(source, *args, **kwargs):
+        key = match_key(source)
+        if key is None:
+            return function(source, *args, **kwargs)
+        key = (key, function.__qualname__, _freeze(args), _freeze(kwargs))
+        try:
+            hash(key)
+        except TypeError:
+            return function(source, *args, **kwargs)
+        return MEMO.get(key, lambda: function(source, *args, **kwargs))
+    return wrapper
@@ -1,4 +1,4 @@
-import json
+from event_store import load_events
 import matplotlib.pyplot as plt
 import pandas as pd
 
@@ -14,8 +14,7 @@ def extract_match_data(events_file_path):
     - list: 추출된 팀 이름 리스트
     - dict: 팀별 볼 점유율
     """
-    with open(events_file_path, 'r', encoding='utf-8') as f:
-        events_data = json.load(f)
+    events_data = load_events(events_file_path)
 
     teams = {}
     team_names = set()
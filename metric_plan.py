@@ -0,0 +1,254 @@
+"""
+경기 통계치를 선언형으로 등록하고, 요청한 통계치들을 한 번의 마스크 계산으로 함께 구하는 모듈
+통계치마다 이벤트 전체를 다시 순회하지 않고, 같은 조건(타입, 결과 ...)의 마스크는 한 번만 만든다
+
+- METRIC_SPECS: 통계치 이름 -> {"filter": 이벤트 조건, "value": 값 종류} 등록표
+- MetricPlan: 요청한 통계치의 조건을 모아서 한 번에 계산하는 클래스
+- match_stats: 팀별 경기 통계와 점유율 (extract_match_data 와 같은 결과)
+- player_records: 선수별 슛, 드리블 성공, 패스 성공 수 (extract_record_data 용)
+
+이벤트 조건 (모든 키를 만족하는 이벤트, 값은 이름 리스트):
+- type / pass_type / card: 이벤트 타입, 패스 종류, 카드 이름
+- outcome: 결과 이름 (None 이면 결과가 없는 이벤트 = 성공한 패스)
+- outcome_present / exclude_outcome: 결과가 있는 이벤트 / 제외할 결과 이름
+- linked_to_opponent: related_events 로 상대 팀(또는 팀 없는) 이벤트와 연결된 이벤트
+- max_x: x 좌표가 이 값보다 작은 이벤트
+- any: 조건 리스트 중 하나라도 만족하는 이벤트
+
+값 종류:
+- count: 이벤트 수 (기본값)
+- locations: 이벤트 위치 (N, 2)
+- pass_locations: 시작/도착 위치 (N, 2)
+- possession: 볼 점유율 (%)
+- rate: "of": (분자, 분모) 통계치의 비율 (%)
+"""
+import numpy as np
+
+from event_codes import as_event_store, is_code, team_order, locations, linked_to_opponent
+
+# 유효슛으로 보는 슛 결과
+ON_TARGET_OUTCOMES = ["Goal", "Saved", "Post"]
+
+FOUL_TYPES = ["Foul Committed", "Bad Behaviour"]
+
+# 턴오버: 실패한 패스, 패배한 듀얼, 드리블 실패(상대 팀 이벤트와 연결된 Carry)
+TURNOVER_FILTERS = [
+    {"type": ["Pass"], "outcome": ["Incomplete"]},
+    {"type": ["Duel"], "outcome": ["Lost In Play", "Lost Out"]},
+    {"type": ["Carry"], "linked_to_opponent": True},
+]
+
+METRIC_SPECS = {
+    "shots": {"filter": {"type": ["Shot"]}},
+    "on_target": {"filter": {"type": ["Shot"], "outcome": ON_TARGET_OUTCOMES}},
+    "passes": {"filter": {"type": ["Pass"]}},
+    "pass_success": {"filter": {"type": ["Pass"], "outcome": None}},
+    "pass_success_rate": {"value": "rate", "of": ("pass_success", "passes")},
+    "fouls": {"filter": {"type": FOUL_TYPES}},
+    "yellow_cards": {"filter": {"type": FOUL_TYPES, "card": ["Yellow Card"]}},
+    "red_cards": {"filter": {"type": FOUL_TYPES, "card": ["Red Card", "Second Yellow"]}},
+    "offsides": {"filter": {"type": ["Pass"], "outcome": ["Pass Offside"]}},
+    # 코너킥은 outcome 이 있고 오프사이드가 아닌 패스만 셈 (기존 extract_match_data 와 같은 조건)
+    "corners": {"filter": {"type": ["Pass"], "outcome_present": True, "exclude_outcome": ["Pass Offside"],
+                           "pass_type": ["Corner"]}},
+    "dribbles_complete": {"filter": {"type": ["Dribble"], "outcome": ["Complete"]}},
+    "possession": {"value": "possession"},
+    "turnover_total": {"filter": {"any": TURNOVER_FILTERS}},
+    # 하프라인 이전 (x<60)에 발생한 턴오버
+    "turnover_half": {"filter": {"any": TURNOVER_FILTERS, "max_x": 60}},
+    "pass_locations": {"filter": {"type": ["Pass"]}, "value": "pass_locations"},
+    "shot_locations": {"filter": {"type": ["Shot"], "outcome": ON_TARGET_OUTCOMES}, "value": "locations"},
+    "turnover_locations": {"filter": {"any": TURNOVER_FILTERS}, "value": "locations"},
+}
+
+# extract_match_data 의 경기 통계 항목
+MATCH_STATS = ["shots", "on_target", "passes", "pass_success", "pass_success_rate", "fouls", "yellow_cards",
+               "red_cards", "offsides", "corners", "possession"]
+
+
+def filter_key(condition):
+    """
+    이벤트 조건을 마스크 캐시 키(튜플)로 변환 (같은 조건이면 같은 키)
+    """
+    items = []
+    for key, value in condition.items():
+        if key == "any":
+            value = tuple(sorted(filter_key(sub) for sub in value))
+        elif isinstance(value, list):
+            value = tuple(sorted(value))
+        items.append((key, value))
+    return tuple(sorted(items, key=repr))
+
+
+class MetricPlan:
+    """
+    요청한 통계치를 한 번에 계산하는 계획
+    통계치들의 조건을 모아 같은 조건의 마스크는 한 번만 만들고, 팀(또는 선수)별 값은 마스크 연산으로 구한다
+
+    속성:
+    - metric_names (list): 요청한 통계치 이름
+    - order (list): 계산 순서 (rate 가 참조하는 통계치 포함)
+    - filter_keys (dict): 통계치 이름 -> 마스크 캐시 키
+    """
+
+    def __init__(self, metric_names, specs=METRIC_SPECS):
+        self.metric_names = list(metric_names)
+        self.specs = specs
+        self.order = []
+        for name in self.metric_names:
+            self._add(name)
+        self.filter_keys = {name: filter_key(specs[name]["filter"]) for name in self.order
+                            if "filter" in specs[name]}
+
+    def _add(self, name):
+        if name not in self.specs:
+            raise ValueError(f"등록되지 않은 통계치입니다: {name}")
+        for dependency in self.specs[name].get("of", ()):
+            self._add(dependency)
+        if name not in self.order:
+            self.order.append(name)
+
+    def masks(self, store):
+        """
+        통계치별 이벤트 마스크 (같은 조건은 한 번만 계산)
+
+        반환값:
+        - dict: 통계치 이름 -> boolean 마스크
+        """
+        columns, names = as_event_store(store)
+        cache = {}
+        return {name: self._filter_mask(self.specs[name]["filter"], columns, names, cache)
+                for name in self.filter_keys}
+
+    def _filter_mask(self, condition, columns, names, cache):
+        key = filter_key(condition)
+        if key in cache:
+            return cache[key]
+
+        outcome_id = columns["outcome_id"]
+        mask = np.ones(len(columns["type_id"]), dtype=bool)
+        for field, value in condition.items():
+            # 조건 하나하나도 캐시해서 여러 통계치가 같은 타입/결과 마스크를 공유
+            field_key = (field, filter_key({field: value}))
+            if field_key not in cache:
+                if field == "any":
+                    field_mask = np.zeros_like(mask)
+                    for sub in value:
+                        field_mask |= self._filter_mask(sub, columns, names, cache)
+                elif field == "type":
+                    field_mask = is_code(columns["type_id"], names, "type", value)
+                elif field == "outcome":
+                    field_mask = outcome_id == -1 if value is None else is_code(outcome_id, names, "outcome", value)
+                elif field == "outcome_present":
+                    field_mask = outcome_id != -1
+                elif field == "exclude_outcome":
+                    field_mask = ~is_code(outcome_id, names, "outcome", value)
+                elif field == "pass_type":
+                    field_mask = is_code(columns["pass_type_id"], names, "pass_type", value)
+                elif field == "card":
+                    field_mask = is_code(columns["card_id"], names, "card", value)
+                elif field == "linked_to_opponent":
+                    field_mask = linked_to_opponent(columns)
+                elif field == "max_x":
+                    field_mask = columns["x"] < value
+                else:
+                    raise ValueError(f"알 수 없는 이벤트 조건입니다: {field}")
+                cache[field_key] = field_mask
+            mask = mask & cache[field_key]
+
+        cache[key] = mask
+        return mask
+
+    def evaluate(self, store, by="team"):
+        """
+        요청한 통계치를 팀별(또는 선수별)로 계산하는 함수
+
+        매개변수:
+        - store: EventTable, (columns, names) 또는 컬럼 파일 경로
+        - by (str): "team" 또는 "player"
+
+        반환값:
+        - dict: 팀(선수) 이름 -> {통계치 이름: 값} (이벤트에 처음 나온 순서)
+        """
+        columns, names = as_event_store(store)
+        masks = self.masks((columns, names))
+
+        if by == "team":
+            group_ids = columns["team_id"]
+            groups = team_order(columns)
+        elif by == "player":
+            # 요청한 통계치에 해당하는 이벤트가 처음 나온 순서
+            recorded = np.zeros(len(columns["type_id"]), dtype=bool)
+            for mask in masks.values():
+                recorded |= mask
+            group_ids = columns["player_id"]
+            groups = team_order({"team_id": np.where(recorded, group_ids, -1)})
+        else:
+            raise ValueError("by 는 'team' 또는 'player' 입니다")
+
+        durations = None
+        results = {}
+        for group in groups:
+            in_group = group_ids == group
+            values = {}
+            for name in self.order:
+                spec = self.specs[name]
+                kind = spec.get("value", "count")
+                if kind == "count":
+                    values[name] = int(np.count_nonzero(masks[name] & in_group))
+                elif kind == "locations":
+                    values[name] = locations(columns, masks[name] & in_group)
+                elif kind == "pass_locations":
+                    mask = masks[name] & in_group
+                    values[name] = np.concatenate([locations(columns, mask), locations(columns, mask, end=True)])
+                elif kind == "possession":
+                    # 이벤트 순서대로 더해서 JSON 이벤트로 계산한 값과 같게 함
+                    if durations is None:
+                        durations = columns["duration"]
+                        total_duration = sum(durations.tolist())
+                    time = sum(durations[columns["possession_team_id"] == group].tolist())
+                    values[name] = (time / total_duration) * 100
+                elif kind == "rate":
+                    numerator, denominator = (values[metric] for metric in spec["of"])
+                    values[name] = round((numerator / denominator) * 100, 2) if denominator > 0 else 0
+                else:
+                    raise ValueError(f"알 수 없는 값 종류입니다: {kind}")
+            results[names[by][group]] = {name: values[name] for name in self.metric_names}
+        return results
+
+
+def match_stats(store, on_target_outcomes=ON_TARGET_OUTCOMES):
+    """
+    팀별 경기 통계를 한 번의 마스크 계산으로 구하는 함수
+
+    매개변수:
+    - store: EventTable, (columns, names) 또는 컬럼 파일 경로
+    - on_target_outcomes: 유효슛으로 보는 슛 결과 이름
+
+    반환값:
+    - dict: 팀 이름 -> 경기 통계 (shots, on_target, passes, pass_success, pass_success_rate, fouls,
+            yellow_cards, red_cards, offsides, corners, turnover_count)
+    - list: 팀 이름 리스트 (이벤트에 처음 나온 순서)
+    - dict: 팀별 볼 점유율
+    """
+    specs = dict(METRIC_SPECS, on_target={"filter": {"type": ["Shot"], "outcome": list(on_target_outcomes)}})
+    results = MetricPlan(MATCH_STATS, specs).evaluate(store)
+
+    teams = {}
+    possession_percentages = {}
+    for team_name, values in results.items():
+        possession_percentages[team_name] = values.pop("possession")
+        teams[team_name] = dict(values, turnover_count=0)
+    return teams, list(teams), possession_percentages
+
+
+def player_records(store):
+    """
+    선수별 슛, 드리블 성공, 패스 성공 수를 한 번의 마스크 계산으로 구하는 함수
+
+    반환값:
+    - dict: 선수 이름 -> {'Dribble', 'Shot', 'Pass'} (기록이 처음 나온 순서)
+    """
+    results = MetricPlan(["dribbles_complete", "shots", "pass_success"]).evaluate(store, by="player")
+    return {player: {"Dribble": values["dribbles_complete"], "Shot": values["shots"], "Pass": values["pass_success"]}
+            for player, values in results.items()}
@@ -0,0 +1,67 @@
+"""
+승리팀/패배팀 통계치 차이를 모든 통계치에 대해 한 번에 검정하는 모듈
+
+- compare_groups: (경기 x 통계치) 행렬과 승리 여부 벡터로 t-test, Mann-Whitney U, Cohen's d 를 한 번에 계산
+"""
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# 유의수준
+ALPHA = 0.05
+
+
+def compare_groups(values, labels, metric_names=None, equal_var=False, alpha=ALPHA):
+    """
+    모든 통계치에 대해 승리팀과 패배팀을 한 번에 비교하는 함수 (통계치 축으로 벡터화)
+
+    매개변수:
+    - values: (경기 수, 통계치 수) 행렬 (팀-경기 하나가 한 행)
+    - labels: 행별 승리 여부 (True: 승리팀, False: 패배팀)
+    - metric_names (list): 통계치 이름 (없으면 0, 1, 2 ...)
+    - equal_var (bool): False 이면 Welch t-test, True 이면 등분산 t-test
+    - alpha (float): 유의수준
+
+    반환값:
+    - pd.DataFrame: 통계치별 검정 결과 (index: 통계치 이름)
+      winner_n, loser_n, winner_mean, loser_mean, winner_std, loser_std,
+      t_stat, p_value, u_stat, u_p_value, cohens_d, significant
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+    labels = np.asarray(labels, dtype=bool)
+    if metric_names is None:
+        metric_names = list(range(values.shape[1]))
+    if len(labels) != len(values) or len(metric_names) != values.shape[1]:
+        raise ValueError("values 의 행/열 수가 labels, metric_names 와 맞지 않습니다")
+
+    winner, loser = values[labels], values[~labels]
+    winner_n, loser_n = len(winner), len(loser)
+
+    winner_mean, loser_mean = winner.mean(axis=0), loser.mean(axis=0)
+    winner_var, loser_var = winner.var(axis=0, ddof=1), loser.var(axis=0, ddof=1)
+
+    t_stat, p_value = stats.ttest_ind(winner, loser, axis=0, equal_var=equal_var)
+    u_stat, u_p_value = stats.mannwhitneyu(winner, loser, axis=0, alternative="two-sided")
+
+    # 합동 표준편차로 나눈 평균 차이
+    pooled_std = np.sqrt(((winner_n - 1) * winner_var + (loser_n - 1) * loser_var) / (winner_n + loser_n - 2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d = np.where(pooled_std > 0, (winner_mean - loser_mean) / pooled_std, np.nan)
+
+    return pd.DataFrame({
+        "winner_n": winner_n,
+        "loser_n": loser_n,
+        "winner_mean": winner_mean,
+        "loser_mean": loser_mean,
+        "winner_std": np.sqrt(winner.var(axis=0)),
+        "loser_std": np.sqrt(loser.var(axis=0)),
+        "t_stat": t_stat,
+        "p_value": p_value,
+        "u_stat": u_stat,
+        "u_p_value": u_p_value,
+        "cohens_d": d,
+        "significant": p_value < alpha,
+    }, index=pd.Index(metric_names, name="metric"))
+
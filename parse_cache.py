@@ -0,0 +1,251 @@
+"""
+이벤트/라인업 JSON 을 한 번 디코딩한 결과를 캐시 폴더에 저장해 두고 다시 사용하는 모듈
+캐시 키는 원본 파일의 (절대 경로, 크기, 수정 시간) 이므로 파일이 바뀌면 자동으로 다시 디코딩한다
+캐시 폴더 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 파일부터 지운다 (LRU)
+
+- configure: 캐시 폴더, 크기 상한, 사용 여부 설정 (환경 변수로도 설정 가능 -> 워커 프로세스에도 적용)
+- cached_file: 원본 파일에 대응하는 캐시 파일 경로 (없으면 build 로 만든 뒤 LRU 정리)
+- cached_path / add_cached_file: 이미 있는 캐시 파일 찾기 / 캐시 파일 추가 (cached_file 을 나눠서 사용할 때)
+- load_cached: 캐시 파일을 읽는 함수 (다른 프로세스가 정리하면서 지운 파일은 다시 만듦)
+- load_json: JSON 로더 (디코딩 결과를 그대로 pickle 로 캐시)
+- load_lineups: 라인업 JSON 로더 (캐시 사용)
+- evict: 크기 상한에 맞게 오래된 캐시 파일 삭제
+
+환경 변수:
+- MATCH_CACHE_DIR: 캐시 폴더 (기본: ~/.cache/match_parse_cache)
+- MATCH_CACHE_MAX_MB: 캐시 크기 상한 (MB, 기본 2048)
+- MATCH_CACHE: "off" 이면 캐시를 사용하지 않음
+"""
+import os
+import json
+import pickle
+import hashlib
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "match_parse_cache")
+DEFAULT_MAX_MB = 2048
+
+# 상한을 넘으면 상한의 이 비율까지 정리 (파일을 추가할 때마다 정리하지 않도록 여유를 둠)
+EVICT_TARGET = 0.9
+
+# 프로세스별로 추정한 캐시 폴더 크기 (폴더 -> 바이트, 처음 한 번만 폴더 전체를 훑고 이후에는 추가한 크기만 더함)
+_cache_sizes = {}
+
+
+def cache_dir():
+    return os.environ.get("MATCH_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+
+def max_bytes():
+    return int(float(os.environ.get("MATCH_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+
+
+def cache_enabled():
+    return os.environ.get("MATCH_CACHE", "on").lower() not in ("off", "0", "false")
+
+
+def configure(directory=None, max_mb=None, enabled=None):
+    """
+    캐시 설정 (환경 변수에 기록하므로 이후에 만드는 워커 프로세스에도 적용)
+
+    매개변수:
+    - directory (str): 캐시 폴더
+    - max_mb (float): 캐시 크기 상한 (MB)
+    - enabled (bool): 캐시 사용 여부
+    """
+    if directory is not None:
+        os.environ["MATCH_CACHE_DIR"] = os.path.abspath(directory)
+    if max_mb is not None:
+        os.environ["MATCH_CACHE_MAX_MB"] = str(max_mb)
+    if enabled is not None:
+        os.environ["MATCH_CACHE"] = "on" if enabled else "off"
+
+
+def cache_key(source_path, member=None):
+    """
+    원본 파일의 (절대 경로, 크기, 수정 시간) 해시 (압축 파일이면 멤버 이름도 포함)
+    """
+    stat = os.stat(source_path)
+    text = f"{os.path.abspath(source_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    if member is not None:
+        text += f"|{member}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def cache_path(source_path, kind, suffix, member=None):
+    """
+    원본 파일에 대응하는 캐시 파일 경로 (파일이 있는지와 상관없이)
+    """
+    return os.path.join(cache_dir(), kind, cache_key(source_path, member) + suffix)
+
+
+def cached_path(source_path, kind, suffix, member=None):
+    """
+    이미 만들어진 캐시 파일 경로 (사용 시간 갱신, 없으면 None)
+    """
+    path = cache_path(source_path, kind, suffix, member)
+    try:
+        # 사용 시간 갱신 (LRU 정리 기준)
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+
+def add_cached_file(source_path, kind, suffix, build, member=None):
+    """
+    build(임시 경로) 로 캐시 파일을 만들고 크기 상한에 맞게 정리
+
+    반환값:
+    - str: 캐시 파일 경로
+    """
+    path = cache_path(source_path, kind, suffix, member)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 다른 프로세스가 같은 파일을 만드는 중이어도 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+    tmp_path = f"{path}.{os.getpid()}.tmp{suffix}"
+    build(tmp_path)
+    os.replace(tmp_path, path)
+    _track_added(path)
+    return path
+
+
+def _track_added(path):
+    """
+    추가한 캐시 파일 크기를 추정 크기에 더하고, 상한을 넘었을 때만 폴더를 훑어서 정리
+    (다른 프로세스가 추가한 크기는 다음 정리 때 반영되므로 상한은 대략적인 값)
+    """
+    directory = cache_dir()
+    if directory not in _cache_sizes:
+        _cache_sizes[directory] = sum(size for _, size, _ in _cache_entries(directory))
+    else:
+        _cache_sizes[directory] += os.path.getsize(path)
+    if _cache_sizes[directory] > max_bytes():
+        evict(int(max_bytes() * EVICT_TARGET), keep=path)
+
+
+def _cache_entries(directory):
+    entries = []
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            # 다른 프로세스가 만드는 중인 임시 파일은 지우면 그 프로세스의 os.replace 가 실패하므로 제외
+            if ".tmp" in filename:
+                continue
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def cached_file(source_path, kind, suffix, build, overwrite=False, member=None):
+    """
+    원본 파일에 대응하는 캐시 파일 경로를 반환하는 함수
+    캐시 파일이 있으면 사용 시간만 갱신하고, 없으면 build(임시 경로) 로 만든 뒤 크기 상한에 맞게 정리
+
+    매개변수:
+    - source_path (str): 원본 JSON 경로
+    - kind (str): 캐시 종류 ("events", "lineups" ...) -> 캐시 폴더 안의 하위 폴더
+    - suffix (str): 캐시 파일 확장자 (".npz", ".pkl" ...)
+    - build: 캐시 파일을 만드는 함수 (경로를 받아서 그 경로에 저장)
+    - overwrite (bool): 캐시 파일이 있어도 다시 만들지 여부
+    - member (str): source_path 가 압축 파일일 때 멤버 이름 (match_archive)
+
+    반환값:
+    - str: 캐시 파일 경로
+    """
+    path = None if overwrite else cached_path(source_path, kind, suffix, member)
+    if path is None:
+        path = add_cached_file(source_path, kind, suffix, build, member)
+    return path
+
+
+def load_cached(source_path, kind, suffix, build, load, member=None):
+    """
+    cached_file 의 캐시 파일을 load(경로) 로 읽는 함수
+    캐시 폴더는 워커 프로세스끼리 공유하므로, 경로를 찾은 뒤 읽기 전에 다른 프로세스의 evict 가 파일을 지웠으면 다시 만들어서 읽음
+
+    매개변수:
+    - load: 캐시 파일 경로를 받아서 내용을 읽는 함수
+    - 나머지는 cached_file 과 같음
+
+    반환값:
+    - load 의 반환값
+    """
+    try:
+        return load(cached_file(source_path, kind, suffix, build, member=member))
+    except FileNotFoundError:
+        # 원본 파일이 없으면 add_cached_file 의 cache_key 에서 다시 FileNotFoundError 가 발생 (그대로 전달)
+        return load(add_cached_file(source_path, kind, suffix, build, member))
+
+
+def evict(limit=None, keep=None):
+    """
+    캐시 폴더 크기가 상한을 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+
+    매개변수:
+    - limit (int): 크기 상한 (바이트, 없으면 설정값)
+    - keep (str): 지우지 않을 파일 (방금 만든 캐시 파일)
+
+    반환값:
+    - int: 삭제한 파일 개수
+    """
+    if limit is None:
+        limit = max_bytes()
+
+    entries = _cache_entries(cache_dir())
+    total = sum(size for _, size, _ in entries)
+
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    _cache_sizes[cache_dir()] = total
+    return removed
+
+
+def load_json(json_path, kind):
+    """
+    JSON 파일을 읽는 함수 (디코딩 결과를 그대로 pickle 로 캐시하므로 원본과 같은 데이터)
+
+    매개변수:
+    - json_path (str): JSON 파일 경로
+    - kind (str): 캐시 종류 (캐시 폴더 안의 하위 폴더)
+    """
+    if not cache_enabled():
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def build(path):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        with open(path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return load_cached(json_path, kind, ".pkl", build, load_pickle)
+
+
+def load_pickle(path):
+    """
+    pickle 캐시 파일을 읽는 함수 (load_cached 의 load 로 사용)
+    """
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def load_lineups(lineup_file_path):
+    """
+    라인업 JSON 을 읽는 함수 (디코딩 결과를 pickle 로 캐시)
+
+    반환값:
+    - list: 팀별 라인업 데이터
+    """
+    return load_json(lineup_file_path, "lineups")
@@ -1,6 +1,9 @@
 import os
 import json
+from event_store import load_events
+from parse_cache import load_lineups
 from heatmap import draw_heatmap
+from match_index import build_match_index, select_team_matches
 
 type = 'pass'
 
@@ -29,27 +32,11 @@ enter any number : """))
 team_name_list = ['Barcelona', 'RC Deportivo La Coruña', 'Racing Santander', 'CD Numancia de Soria']
 team_name = team_name_list[team_name_id]
 
-# 선택한 팀이 한 match 데이터 추출
+# 선택한 팀이 한 match 데이터 추출 (바뀐 시즌 파일만 다시 읽는 경기 인덱스에서 조회)
 folder_path_laliga = 'C:/CODING/python/Infophy_TeamProject/Laliga_10_21'
 
-json_files_laliga = [f for f in os.listdir(folder_path_laliga) if f.endswith('.json')]
-
-match_data_list = []
-k = 0
-for filename in json_files_laliga:
-    file_path = os.path.join(folder_path_laliga,filename)
-
-    with open(file_path,'r', encoding='utf-8') as f:
-        data = json.load(f)
-        for i in data:
-            if i['home_team']['home_team_name'] == team_name:
-                match_id = str(i['match_id']) + '.json'
-                side = 'home'
-                match_data_list.append((match_id, side))
-            elif i['away_team']['away_team_name'] == team_name:
-                match_id = str(i['match_id']) + '.json'
-                side = 'away'
-                match_data_list.append((match_id, side))
+match_index = build_match_index(folder_path_laliga)
+match_data_list = [(str(match_id) + '.json', side) for match_id, side in select_team_matches(match_index, team_name)]
 
 
 # pass location 데이터 추출
@@ -57,15 +44,14 @@ folder_path_events = 'C:/Users/user/local/GitHub/open-data/data/events'
 folder_path_lineups = 'C:/Users/user/local/GitHub/open-data/data/lineups'
 
 pass_location = []
-for match_id, side in (match_data_list):
+for k, (match_id, side) in enumerate(match_data_list):
     file_path_event = os.path.join(folder_path_events, match_id)
     file_path_lineup = os.path.join(folder_path_lineups, match_id)
     
 
-    with open(file_path_event, 'r', encoding= 'utf-8') as f:
-        events = json.load(f)
-    with open(file_path_lineup, 'r', encoding= 'utf-8') as f:
-        lineup = json.load(f)
+    # 두 번째 실행부터는 parse_cache 의 캐시를 사용 (JSON 을 다시 디코딩하지 않음)
+    events = load_events(file_path_event)
+    lineup = load_lineups(file_path_lineup)
         
     if side == 'home':
         lineup_info = lineup[0]
@@ -98,7 +84,6 @@ for match_id, side in (match_data_list):
             pass_location.append(event["pass"]["end_location"])
     
     print(f'{k+1} in {len(match_data_list)}')  
-    k += 1      
 
 # heatmap으로 표현
 draw_heatmap(pass_location, team_name, type)
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+축구장 그리기 공용 모듈
+
+- pitch_lines: 축구장 라인 좌표 계산 (필드 크기별로 한 번만 계산해서 캐시)
+- draw_soccer_field: 캐시된 라인을 LineCollection 하나로 그리고 홈/어웨이 진영 표시
+"""
+from functools import lru_cache
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+# 홈/어웨이 진영 색
+SIDE_COLORS = {"home": "lightblue", "away": "lightcoral"}
+
+
+@lru_cache(maxsize=None)
+def pitch_lines(field_dimen=(120, 80)):
+    """
+    축구장 라인(외곽선, 센터 라인, 센터 서클, 페널티/골키퍼 구역, 골대) 좌표를 계산하는 함수
+
+    매개변수:
+    - field_dimen (tuple): 필드의 크기 (길이, 너비)
+
+    반환값:
+    - tuple: 라인별 (N, 2) 좌표 배열 (마지막이 센터 서클)
+    """
+    field_length, field_width = field_dimen
+
+    def box(depth, height):
+        # 양쪽 골라인에서 시작하는 구역 (페널티, 골키퍼)
+        low, high = (field_width - height) / 2, (field_width + height) / 2
+        return [
+            [(0, low), (depth, low), (depth, high), (0, high)],
+            [(field_length, low), (field_length - depth, low), (field_length - depth, high), (field_length, high)],
+        ]
+
+    goal_low, goal_high = (field_width - 7.32) / 2, (field_width + 7.32) / 2
+    lines = [
+        # 필드 외곽선
+        [(0, 0), (0, field_width), (field_length, field_width), (field_length, 0), (0, 0)],
+        # 센터 라인
+        [(field_length / 2, 0), (field_length / 2, field_width)],
+        # 페널티 구역, 골키퍼 구역
+        *box(16.5, 40.3),
+        *box(5.5, 18.32),
+        # 골대
+        [(0, goal_low), (-2, goal_low)],
+        [(0, goal_high), (-2, goal_high)],
+        [(field_length, goal_low), (field_length + 2, goal_low)],
+        [(field_length, goal_high), (field_length + 2, goal_high)],
+    ]
+
+    # 센터 서클
+    theta = np.linspace(0, 2 * np.pi, 181)
+    lines.append(np.column_stack([field_length / 2 + 9.15 * np.cos(theta), field_width / 2 + 9.15 * np.sin(theta)]))
+
+    return tuple(np.asarray(line, dtype=float) for line in lines)
+
+
+def draw_soccer_field(ax, side=None, field_dimen=(120, 80), color="black"):
+    """
+    축구 필드 그리기
+    라인 좌표는 필드 크기별로 캐시하고 LineCollection 하나로 그려서 그림마다 ax.plot 을 반복하지 않음
+
+    매개변수:
+    - ax (matplotlib.axes): 필드를 그릴 matplotlib 축
+    - side (str): "home" 또는 "away" (해당 팀 진영을 왼쪽으로 색 표시, None 이면 표시하지 않음)
+    - field_dimen (tuple): 필드의 크기 (길이, 너비)
+    - color (str): 라인 색
+
+    반환값:
+    - ax (matplotlib.axes): 축구 필드가 그려진 matplotlib 축
+    """
+    field_length, field_width = field_dimen
+    lines = pitch_lines(tuple(field_dimen))
+
+    # 홈/어웨이 진영 배경색 표시 (범례 순서는 항상 Home, Away)
+    if side in ("home", "away"):
+        home_x = 0 if side == "home" else field_length / 2
+        away_x = field_length / 2 - home_x
+        ax.add_patch(plt.Rectangle((home_x, 0), field_length / 2, field_width, color=SIDE_COLORS["home"], alpha=0.2,
+                                   label="Home Side"))
+        ax.add_patch(plt.Rectangle((away_x, 0), field_length / 2, field_width, color=SIDE_COLORS["away"], alpha=0.2,
+                                   label="Away Side"))
+
+    # 라인 전체를 한 번에 그림 (ax.plot 과 같은 zorder, 센터 서클은 기존 Circle 패치와 같은 두께)
+    widths = [plt.rcParams["lines.linewidth"]] * (len(lines) - 1) + [plt.rcParams["patch.linewidth"]]
+    ax.add_collection(LineCollection(lines, colors=color, linewidths=widths, zorder=2))
+    ax.scatter(field_length / 2, field_width / 2, color=color, s=20)  # 센터 스팟
+
+    ax.set_xlim(-5, field_length + 5)
+    ax.set_ylim(-5, field_width + 5)
+    ax.set_aspect("equal", adjustable="box")
+    return ax
@@ -1,26 +1,22 @@
-import json
+from event_stream import iter_events
 
 def calculate_possession(events_file_path):
     """
     JSON 데이터를 기반으로 팀별 볼 점유율을 계산하는 함수
 
     매개변수:
-    - file_path (str): JSON 파일 경로
+    - events_file_path (str): JSON 파일 경로 (이벤트를 하나씩 읽어서 파일 크기와 상관없이 메모리 사용량 유지)
 
     반환값:
     - dict: 팀별 볼 점유율
     - float: 총 경기 시간(분 단위)
     """
-    # JSON 파일 로드
-    with open(events_file_path, 'r', encoding='utf-8') as file:
-        data = json.load(file)
-
     # 변수 초기화
     team_possession = {}
     total_duration = 0
 
     # 데이터 분석
-    for event in data:
+    for event in iter_events(events_file_path):
         possession_team = event.get("possession_team", {}).get("name", None)
         duration = event.get("duration", 0)
         total_duration += duration
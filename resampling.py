@@ -0,0 +1,172 @@
+"""
+정규분포를 가정하지 않는 승리팀/패배팀 평균 차이 검정 모듈 (순열 검정, 부트스트랩 신뢰구간)
+재표본은 묶음 단위 행렬 연산으로 한 번에 계산하고, jobs 를 지정하면 묶음을 여러 프로세스로 나눠 계산한다
+
+- permutation_test: 승패 라벨을 섞어서 평균 차이의 p-value 계산
+- bootstrap_ci: 그룹별 복원 추출로 평균 차이의 신뢰구간 계산
+- resample_tests: 두 결과를 통계치별 표 하나로 반환
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# 한 번의 행렬 연산에서 만드는 (재표본 수, 행 수) 행렬의 최대 크기 (환경 변수 RESAMPLE_BATCH_MB, 기본 64MB)
+BATCH_BYTES = int(os.environ.get("RESAMPLE_BATCH_MB", 64)) * 1024 * 1024
+
+
+def batch_size(n_rows, budget_bytes=None):
+    """
+    (재표본 수, n_rows) float 행렬이 budget_bytes 를 넘지 않는 재표본 수 (최소 1)
+    """
+    if budget_bytes is None:
+        budget_bytes = BATCH_BYTES
+    return max(1, budget_bytes // (8 * max(1, n_rows)))
+
+
+def _as_matrix(values, labels):
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+    labels = np.asarray(labels, dtype=bool)
+    if len(labels) != len(values):
+        raise ValueError("values 의 행 수와 labels 길이가 맞지 않습니다")
+    return values, labels
+
+
+def mean_difference(values, labels):
+    """
+    통계치별 승리팀 평균 - 패배팀 평균
+    """
+    values, labels = _as_matrix(values, labels)
+    return values[labels].mean(axis=0) - values[~labels].mean(axis=0)
+
+
+def _permutation_batch(values, labels, observed, n_resamples, seed):
+    """
+    라벨을 n_resamples 번 섞었을 때 |평균 차이| 가 관측값 이상인 횟수 (통계치별)
+    섞은 라벨 행렬 (재표본 수, 행 수) 과 값 행렬의 곱으로 그룹 합계를 한 번에 계산
+    """
+    rng = np.random.default_rng(seed)
+    n_winner = labels.sum()
+    n_loser = len(labels) - n_winner
+    total = values.sum(axis=0)
+
+    extreme = np.zeros(values.shape[1], dtype=np.int64)
+    step = batch_size(len(labels))
+    for start in range(0, n_resamples, step):
+        size = min(step, n_resamples - start)
+        permuted = rng.permuted(np.tile(labels, (size, 1)), axis=1).astype(float)
+        winner_sum = permuted @ values
+        diff = winner_sum / n_winner - (total - winner_sum) / n_loser
+        # 부동소수점 오차로 관측값과 같은 차이를 놓치지 않도록 약간의 여유를 둠
+        extreme += np.count_nonzero(np.abs(diff) >= np.abs(observed) - 1e-12, axis=0)
+    return extreme
+
+
+def _bootstrap_batch(values, labels, n_resamples, seed):
+    """
+    그룹별 복원 추출 n_resamples 번의 평균 차이 (재표본 수, 통계치 수)
+    추출 횟수 행렬 (재표본 수, 그룹 크기) 과 값 행렬의 곱으로 평균을 한 번에 계산
+    """
+    rng = np.random.default_rng(seed)
+    winner, loser = values[labels], values[~labels]
+
+    # 추출 횟수 행렬은 그룹별로 (재표본 수, 그룹 크기) 이므로 큰 그룹 기준으로 묶음 크기를 정함
+    diffs = []
+    step = batch_size(max(len(winner), len(loser)))
+    for start in range(0, n_resamples, step):
+        size = min(step, n_resamples - start)
+        means = []
+        for group in (winner, loser):
+            n = len(group)
+            counts = rng.multinomial(n, np.full(n, 1 / n), size=size)
+            means.append(counts @ group / n)
+        diffs.append(means[0] - means[1])
+    return np.concatenate(diffs)
+
+
+def _split_resamples(n_resamples, seed, jobs):
+    """
+    재표본 수를 jobs 개로 나누고 각각 독립된 난수 seed 를 만듦
+    """
+    jobs = max(1, min(jobs, n_resamples))
+    sizes = [n_resamples // jobs + (i < n_resamples % jobs) for i in range(jobs)]
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    seeds = seed.spawn(jobs)
+    return sizes, seeds
+
+
+def permutation_test(values, labels, n_resamples=10000, seed=None, jobs=1):
+    """
+    승패 라벨을 섞는 순열 검정 (양측, 통계치별)
+
+    매개변수:
+    - values: (팀-경기 수, 통계치 수) 행렬
+    - labels: 행별 승리 여부
+    - n_resamples (int): 순열 횟수
+    - seed: 난수 seed (같은 seed, 같은 jobs 이면 같은 결과)
+    - jobs (int): 프로세스 개수 (1이면 현재 프로세스에서 계산)
+
+    반환값:
+    - np.ndarray: 관측된 평균 차이
+    - np.ndarray: p-value ((극단값 수 + 1) / (순열 횟수 + 1))
+    """
+    values, labels = _as_matrix(values, labels)
+    observed = mean_difference(values, labels)
+    sizes, seeds = _split_resamples(n_resamples, seed, jobs)
+
+    if len(sizes) == 1:
+        extreme = _permutation_batch(values, labels, observed, sizes[0], seeds[0])
+    else:
+        with ProcessPoolExecutor(max_workers=len(sizes)) as executor:
+            extreme = sum(executor.map(_permutation_batch, [values] * len(sizes), [labels] * len(sizes),
+                                       [observed] * len(sizes), sizes, seeds))
+    return observed, (extreme + 1) / (n_resamples + 1)
+
+
+def bootstrap_ci(values, labels, n_resamples=10000, confidence=0.95, seed=None, jobs=1):
+    """
+    평균 차이(승리팀 - 패배팀)의 부트스트랩 백분위 신뢰구간 (통계치별)
+
+    반환값:
+    - np.ndarray: 신뢰구간 하한
+    - np.ndarray: 신뢰구간 상한
+    """
+    values, labels = _as_matrix(values, labels)
+    sizes, seeds = _split_resamples(n_resamples, seed, jobs)
+
+    if len(sizes) == 1:
+        diffs = _bootstrap_batch(values, labels, sizes[0], seeds[0])
+    else:
+        with ProcessPoolExecutor(max_workers=len(sizes)) as executor:
+            diffs = np.concatenate(list(executor.map(_bootstrap_batch, [values] * len(sizes),
+                                                     [labels] * len(sizes), sizes, seeds)))
+
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(diffs, [tail, 100 - tail], axis=0)
+    return low, high
+
+
+def resample_tests(values, labels, metric_names=None, n_resamples=10000, confidence=0.95, seed=None, jobs=1):
+    """
+    순열 검정 p-value 와 부트스트랩 신뢰구간을 통계치별 표로 반환
+
+    반환값:
+    - pd.DataFrame: index 는 통계치 이름, 열은 mean_diff, perm_p_value, ci_low, ci_high
+    """
+    values, labels = _as_matrix(values, labels)
+    if metric_names is None:
+        metric_names = list(range(values.shape[1]))
+
+    seeds = np.random.SeedSequence(seed).spawn(2)
+    observed, p_value = permutation_test(values, labels, n_resamples, seeds[0], jobs)
+    low, high = bootstrap_ci(values, labels, n_resamples, confidence, seeds[1], jobs)
+    return pd.DataFrame({
+        "mean_diff": observed,
+        "perm_p_value": p_value,
+        "ci_low": low,
+        "ci_high": high,
+    }, index=pd.Index(metric_names, name="metric"))
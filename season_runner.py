@@ -0,0 +1,323 @@
+"""
+시즌 단위 경기 데이터 처리를 여러 프로세스로 나눠 실행하는 모듈
+
+- process_match: 한 경기를 처리해서 승리팀/패배팀 통계치와 히트맵 누적기를 반환 (워커)
+- safe_process_match: process_match 에서 난 예외를 결과로 반환 (한 경기 때문에 전체 실행이 멈추지 않게 함)
+- SeasonResult: 경기별 결과를 합치는 클래스 (통계치는 RunningStats 로도 누적)
+- map_matches: 경기별 처리 결과를 입력 순서대로 반환 (jobs 개의 프로세스)
+- run_season: ProcessPoolExecutor 로 경기들을 병렬 처리하고 결과를 합침 (저장소를 지정하면 바뀐 경기만 계산)
+- save_checkpoint / load_checkpoint: 합친 결과와 처리한 경기 id 를 파일로 저장 / 불러오기 (이어서 실행)
+"""
+import os
+import pickle
+import traceback
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from tqdm import tqdm
+
+from event_table import EventTable
+from match_archive import MatchArchive
+from season_store import SeasonStore, events_stamp
+from event_codes import side_team
+from metric_plan import MetricPlan
+from heatmap import HeatmapAccumulator
+from streaming_stats import RunningStats
+
+GROUPS = ["winner", "loser"]
+
+# 경기별 통계치 이름
+METRICS = ["passes", "pass_success_rate", "on_target", "possession", "turnover_total", "turnover_half", "fouls"]
+
+# 히트맵 종류
+GRID_KINDS = ["pass", "shot", "turnover"]
+
+# 통계치와 히트맵 위치를 한 번의 마스크 계산으로 구하는 계획 (metric_plan.METRIC_SPECS 의 이름)
+SEASON_PLAN = MetricPlan(METRICS + [f"{kind}_locations" for kind in GRID_KINDS])
+
+# 히트맵 해상도 (가로 구간 수, 세로 구간 수), 첫 번째가 기본 해상도
+DEFAULT_RESOLUTIONS = ((24, 16),)
+
+# 체크포인트(또는 저장소 commit) 간격 (경기 수)
+CHECKPOINT_EVERY = 50
+
+
+def process_match(match_result, events_dir, resolutions=DEFAULT_RESOLUTIONS):
+    """
+    한 경기의 승리팀/패배팀 통계치와 히트맵 구간 개수를 계산하는 함수 (워커 프로세스에서 실행)
+    이벤트는 컬럼 배열 테이블(EventTable)로 로드하고, 모든 통계치를 SEASON_PLAN 으로 한 번에 계산
+
+    매개변수:
+    - match_result (dict): {'match_id', 'winner', 'loser'} ('Home' 또는 'Away')
+    - events_dir (str 또는 MatchArchive): 이벤트 파일 폴더 또는 open-data 압축 파일
+    - resolutions: 히트맵 해상도 리스트
+
+    반환값:
+    - dict: {'match_id', 'metrics': {group: {metric: 값}}, 'grids': {group: {kind: HeatmapAccumulator}}}
+    - None: 이벤트 파일이 없는 경우
+    """
+    match_id = match_result['match_id']
+    if isinstance(events_dir, MatchArchive):
+        table = events_dir.event_table(match_id)
+        if table is None:
+            return None
+    else:
+        event_file_path = os.path.join(events_dir, f'{match_id}.json')
+        if not os.path.exists(event_file_path):
+            return None
+        table = EventTable.from_file(event_file_path)
+
+    values = SEASON_PLAN.evaluate(table)
+
+    summary = {'match_id': match_id, 'metrics': {}, 'grids': {}}
+    for group in GROUPS:
+        team_name = table.names['team'][side_team(table.columns, match_result[group])]
+        summary['metrics'][group] = {metric: values[team_name][metric] for metric in METRICS}
+        summary['grids'][group] = {
+            kind: HeatmapAccumulator(resolutions).add(values[team_name][f"{kind}_locations"]) for kind in GRID_KINDS
+        }
+    return summary
+
+
+def safe_process_match(match_result, events_dir, resolutions=DEFAULT_RESOLUTIONS):
+    """
+    process_match 를 실행하고 예외가 나면 {'match_id', 'error'} 를 반환하는 함수 (워커 프로세스에서 실행)
+    """
+    try:
+        return process_match(match_result, events_dir, resolutions)
+    except Exception as e:
+        error = "".join(traceback.format_exception_only(type(e), e)).strip()
+        return {'match_id': match_result['match_id'], 'error': error}
+
+
+class SeasonResult:
+    """
+    경기별 처리 결과를 합친 시즌 결과
+
+    속성:
+    - match_ids (list): 처리된 경기 id
+    - missing_match_ids (list): 이벤트 파일이 없어 건너뛴 경기 id
+    - quarantined (dict): 처리 중 오류가 난 경기 id -> (오류 메시지, 이벤트 파일 (크기, 수정 시간))
+      (이어서 실행할 때 이벤트 파일이 바뀌지 않았으면 다시 시도하지 않음)
+    - metrics (dict): group -> metric -> 경기별 값 리스트 (keep_values=False 이면 빈 리스트)
+    - stats (dict): group -> metric -> RunningStats (경기별 값 없이 평균, 표준편차, 최솟값/최댓값, t-test 계산)
+    - heatmaps (dict): group -> kind -> HeatmapAccumulator (경기 수와 상관없이 크기 일정)
+    - grids (dict): group -> kind -> 기본 해상도의 구간별 개수 합계
+    """
+
+    def __init__(self, resolutions=DEFAULT_RESOLUTIONS, keep_values=True):
+        self.resolutions = [tuple(resolution) for resolution in resolutions]
+        self.match_ids = []
+        self.missing_match_ids = []
+        self.quarantined = {}
+        self.keep_values = keep_values
+        self.metrics = {group: {metric: [] for metric in METRICS} for group in GROUPS}
+        self.stats = {group: {metric: RunningStats() for metric in METRICS} for group in GROUPS}
+        self.heatmaps = {group: {kind: HeatmapAccumulator(resolutions) for kind in GRID_KINDS} for group in GROUPS}
+
+    @property
+    def grids(self):
+        return {group: {kind: heatmap.grid() for kind, heatmap in kinds.items()} for group, kinds in self.heatmaps.items()}
+
+    def matrix(self, metrics=METRICS):
+        """
+        경기별 값을 (팀-경기 수, 통계치 수) 행렬과 승리 여부 벡터로 반환 (metric_tests.compare_groups 입력)
+
+        반환값:
+        - np.ndarray: 승리팀 행 다음에 패배팀 행
+        - np.ndarray: 행별 승리 여부
+        """
+        if not self.keep_values:
+            raise ValueError("keep_values=False 로 만든 SeasonResult 에는 경기별 값이 없습니다")
+        rows = [np.column_stack([self.metrics[group][metric] for metric in metrics]) for group in GROUPS]
+        labels = np.concatenate([np.full(len(block), group == "winner") for group, block in zip(GROUPS, rows)])
+        return np.concatenate(rows), labels
+
+    def add(self, summary):
+        """
+        process_match 결과 하나를 합침
+        """
+        self.match_ids.append(summary['match_id'])
+        for group in GROUPS:
+            for metric in METRICS:
+                value = summary['metrics'][group][metric]
+                self.stats[group][metric].add(value)
+                if self.keep_values:
+                    self.metrics[group][metric].append(value)
+            for kind in GRID_KINDS:
+                self.heatmaps[group][kind].merge(summary['grids'][group][kind])
+
+    def merge(self, other):
+        """
+        다른 SeasonResult 를 합침
+        """
+        self.match_ids.extend(other.match_ids)
+        self.missing_match_ids.extend(other.missing_match_ids)
+        self.quarantined.update(other.quarantined)
+        for group in GROUPS:
+            for metric in METRICS:
+                self.stats[group][metric].merge(other.stats[group][metric])
+                if self.keep_values:
+                    self.metrics[group][metric].extend(other.metrics[group][metric])
+            for kind in GRID_KINDS:
+                self.heatmaps[group][kind].merge(other.heatmaps[group][kind])
+
+
+def collect_summaries(season, match_results, summaries, progress, events_dir=None, checkpoint_path=None,
+                      checkpoint_every=CHECKPOINT_EVERY):
+    """
+    process_match 결과들을 tqdm 진행 상황과 함께 SeasonResult 에 합침
+    오류가 난 경기는 quarantined 에 기록하고, checkpoint_path 가 있으면 checkpoint_every 경기마다
+    (그리고 중간에 멈추면 멈춘 시점까지) 체크포인트를 저장
+    """
+    try:
+        for count, (match_result, summary) in enumerate(tqdm(zip(match_results, summaries), **progress), 1):
+            if summary is None:
+                season.missing_match_ids.append(match_result['match_id'])
+            elif 'error' in summary:
+                stamp = events_stamp(events_dir, match_result['match_id']) if events_dir is not None else None
+                season.quarantined[match_result['match_id']] = (summary['error'], stamp)
+            else:
+                season.add(summary)
+            if checkpoint_path is not None and count % checkpoint_every == 0:
+                save_checkpoint(season, checkpoint_path)
+    finally:
+        if checkpoint_path is not None:
+            save_checkpoint(season, checkpoint_path)
+
+
+def save_checkpoint(season, checkpoint_path):
+    """
+    SeasonResult (합친 누적기, 처리한 경기 id, quarantined) 를 파일로 저장
+    임시 파일에 쓴 뒤 교체하므로 저장 중에 멈춰도 이전 체크포인트는 남아 있음
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(checkpoint_path)), exist_ok=True)
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'config': season_config(season.resolutions), 'keep_values': season.keep_values, 'season': season},
+                    f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def load_checkpoint(checkpoint_path, resolutions=DEFAULT_RESOLUTIONS, keep_values=True):
+    """
+    save_checkpoint 로 저장한 SeasonResult 를 불러오는 함수
+
+    반환값:
+    - SeasonResult: 저장된 시즌 결과
+    - None: 체크포인트 파일이 없는 경우
+    """
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path, 'rb') as f:
+        checkpoint = pickle.load(f)
+    if checkpoint['config'] != season_config(resolutions) or checkpoint['keep_values'] != keep_values:
+        raise ValueError(f"체크포인트의 통계치/히트맵 설정이 현재 설정과 다릅니다: {checkpoint_path}")
+    return checkpoint['season']
+
+
+def map_matches(match_results, worker, jobs=1):
+    """
+    경기별 worker 결과를 입력 순서대로 반환하는 제너레이터 (jobs 개의 프로세스로 나눠 처리)
+    """
+    if jobs <= 1:
+        yield from map(worker, match_results)
+        return
+
+    # 작업을 잘게 나눠서 프로세스 간 부하를 맞추고, 결과는 입력 순서대로 반환
+    chunksize = max(1, len(match_results) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(worker, match_results, chunksize=chunksize)
+
+
+def season_config(resolutions=DEFAULT_RESOLUTIONS):
+    """
+    저장소(SeasonStore)에 기록하는 설정 (통계치, 히트맵 종류, 해상도가 바뀌면 저장된 결과를 쓰지 않음)
+    """
+    return repr((METRICS, GRID_KINDS, [tuple(resolution) for resolution in resolutions]))
+
+
+def run_season(match_results, events_dir, jobs=1, resolutions=DEFAULT_RESOLUTIONS, keep_values=True,
+               store_path=None, checkpoint_path=None, resume=False, checkpoint_every=CHECKPOINT_EVERY):
+    """
+    경기 목록을 jobs 개의 프로세스로 나눠 처리하고 결과를 합치는 함수
+    처리 중 오류가 난 경기는 건너뛰고 SeasonResult.quarantined 에 기록
+
+    매개변수:
+    - match_results (list): {'match_id', 'winner', 'loser'} 리스트
+    - events_dir (str 또는 MatchArchive): 이벤트 파일 폴더 또는 open-data 압축 파일
+      (tar 압축 파일이면 압축 파일 안의 순서대로 처리, 경기별 값의 순서가 바뀜)
+    - jobs (int): 워커 프로세스 개수 (1이면 현재 프로세스에서 순서대로 처리)
+    - resolutions: 히트맵 해상도 리스트 (여러 개를 지정하면 모두 함께 누적)
+    - keep_values (bool): 경기별 값 리스트 보관 여부 (False 이면 RunningStats 만 누적)
+    - store_path (str): 경기별 결과 저장소(SQLite) 경로 (지정하면 새로 추가되거나 바뀐 경기만 계산하고,
+      나머지는 저장된 결과를 합침, checkpoint_every 경기마다 commit 하므로 멈춰도 다음 실행에서 이어짐)
+    - checkpoint_path (str): 체크포인트 파일 경로 (저장소 없이 실행할 때 checkpoint_every 경기마다 저장)
+    - resume (bool): 체크포인트가 있으면 불러와서 처리하지 않은 경기만 이어서 처리
+      (저장소가 이미 이어서 처리하므로 store_path 와 함께 지정하면 ValueError)
+    - checkpoint_every (int): 체크포인트 간격 (경기 수)
+
+    반환값:
+    - SeasonResult: 합쳐진 시즌 결과
+    """
+    if resume and store_path is not None:
+        raise ValueError("resume 은 체크포인트용이며, store_path 를 지정하면 저장소에서 자동으로 이어서 처리합니다")
+
+    # zip 은 멤버를 바로 찾아 읽을 수 있지만, tar 는 앞으로만 읽어야 빠름
+    if isinstance(events_dir, MatchArchive) and not events_dir.is_zip:
+        match_results = events_dir.sort_match_results(match_results)
+
+    season = SeasonResult(resolutions, keep_values)
+    worker = partial(safe_process_match, events_dir=events_dir, resolutions=resolutions)
+    progress = dict(total=len(match_results), desc="Processing matches", unit="match")
+
+    if store_path is None:
+        if resume and checkpoint_path is not None:
+            season = load_checkpoint(checkpoint_path, resolutions, keep_values) or season
+            # 이미 합친 경기와, 이벤트 파일이 바뀌지 않은 quarantined 경기는 건너뜀
+            done = set(season.match_ids) | set(season.missing_match_ids)
+            done |= {match_id for match_id, (_, stamp) in season.quarantined.items()
+                     if stamp == events_stamp(events_dir, match_id)}
+            match_results = [match_result for match_result in match_results if match_result['match_id'] not in done]
+            for match_id in set(season.quarantined) - done:
+                del season.quarantined[match_id]
+            progress['total'] = len(match_results)
+
+        collect_summaries(season, match_results, map_matches(match_results, worker, jobs), progress,
+                          events_dir, checkpoint_path, checkpoint_every)
+        return season
+
+    store = SeasonStore(store_path, season_config(resolutions))
+    try:
+        # 저장된 결과와 승패, 이벤트 파일의 크기와 수정 시간이 다른 경기만 다시 계산
+        stamps = [events_stamp(events_dir, match_result['match_id']) for match_result in match_results]
+        stored = store.stamps()
+        stale = [(match_result, stamp) for match_result, stamp in zip(match_results, stamps)
+                 if stamp is not None and not store.is_fresh(match_result, stamp, stored)]
+
+        # 오류가 난 경기는 저장하지 않으므로 다음 실행에서 다시 시도
+        errors = {}
+        stale_results = [match_result for match_result, _ in stale]
+        summaries = map_matches(stale_results, worker, jobs)
+        for count, ((match_result, stamp), summary) in enumerate(
+                tqdm(zip(stale, summaries), total=len(stale), desc="Processing new matches", unit="match"), 1):
+            if summary is not None and 'error' in summary:
+                errors[match_result['match_id']] = (summary['error'], stamp)
+            elif summary is not None:
+                store.put(match_result, stamp, summary)
+            if count % checkpoint_every == 0:
+                store.commit()
+        store.commit()
+
+        # 저장된 경기별 결과를 입력 순서대로 다시 합침 (전체를 메모리에 올리지 않고 하나씩 읽음)
+        kept = [(match_result, stamp) for match_result, stamp in zip(match_results, stamps)
+                if match_result['match_id'] not in errors]
+        summaries = (store.summary(match_result['match_id']) if stamp is not None else None
+                     for match_result, stamp in kept)
+        collect_summaries(season, [match_result for match_result, _ in kept], summaries,
+                          dict(progress, total=len(kept), desc="Merging matches"))
+        season.quarantined.update(errors)
+    finally:
+        store.close()
+    return season
@@ -0,0 +1,106 @@
+"""
+경기별 처리 결과(season_runner.process_match 결과)를 SQLite 파일에 저장해 두고 다음 실행에서 재사용하는 모듈
+이벤트 파일의 크기와 수정 시간, 승패가 같은 경기는 다시 계산하지 않고 새로 추가되거나 바뀐 경기만 계산한다
+
+- SeasonStore: 경기별 결과 저장소 (stamps, summary, put)
+- events_stamp: 이벤트 파일(또는 압축 파일 멤버)의 (크기, 수정 시간)
+"""
+import os
+import pickle
+import sqlite3
+
+from match_archive import MatchArchive
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS match_summaries (
+    match_id INTEGER,
+    config TEXT,
+    winner TEXT,
+    loser TEXT,
+    events_size INTEGER,
+    events_mtime REAL,
+    summary BLOB,
+    PRIMARY KEY (match_id, config)
+);
+"""
+
+DEFAULT_STORE_NAME = "season_store.sqlite"
+
+
+def events_stamp(events_dir, match_id):
+    """
+    경기 이벤트 파일의 (크기, 수정 시간)
+
+    매개변수:
+    - events_dir (str 또는 MatchArchive): 이벤트 파일 폴더 또는 open-data 압축 파일
+    - match_id: 경기 id
+
+    반환값:
+    - tuple: (크기, 수정 시간)
+    - None: 이벤트 파일이 없는 경우
+    """
+    if isinstance(events_dir, MatchArchive):
+        _, size, mtime = events_dir.member_info("events", f"{match_id}.json")
+        return None if size is None else (size, mtime)
+
+    event_file_path = os.path.join(events_dir, f"{match_id}.json")
+    if not os.path.exists(event_file_path):
+        return None
+    stat = os.stat(event_file_path)
+    return stat.st_size, stat.st_mtime
+
+
+class SeasonStore:
+    """
+    경기별 처리 결과 저장소
+    같은 파일에 통계치/히트맵 설정(config)이 다른 결과를 함께 저장할 수 있다
+
+    속성:
+    - conn (sqlite3.Connection): 저장소 연결
+    - config (str): 통계치, 히트맵 종류, 해상도 설정 (설정이 바뀌면 모든 경기를 다시 계산)
+    """
+
+    def __init__(self, db_path, config):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(SCHEMA)
+        self.config = config
+
+    def stamps(self):
+        """
+        저장된 경기별 (승리팀, 패배팀, 이벤트 크기, 이벤트 수정 시간)
+
+        반환값:
+        - dict: match_id -> (winner, loser, events_size, events_mtime)
+        """
+        query = "SELECT match_id, winner, loser, events_size, events_mtime FROM match_summaries WHERE config = ?"
+        return {row[0]: tuple(row[1:]) for row in self.conn.execute(query, (self.config,))}
+
+    def is_fresh(self, match_result, stamp, stamps):
+        """
+        저장된 결과를 그대로 쓸 수 있는지 (승패와 이벤트 파일의 크기, 수정 시간이 같은지)
+        """
+        return stamps.get(match_result['match_id']) == (match_result['winner'], match_result['loser']) + tuple(stamp)
+
+    def summary(self, match_id):
+        """
+        저장된 경기 결과 (없으면 None)
+        """
+        row = self.conn.execute("SELECT summary FROM match_summaries WHERE match_id = ? AND config = ?",
+                                (match_id, self.config)).fetchone()
+        return None if row is None else pickle.loads(row[0])
+
+    def put(self, match_result, stamp, summary):
+        """
+        경기 결과 저장 (commit 은 호출한 쪽에서)
+        """
+        self.conn.execute("INSERT OR REPLACE INTO match_summaries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                          (match_result['match_id'], self.config, match_result['winner'], match_result['loser'],
+                           stamp[0], stamp[1], pickle.dumps(summary, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
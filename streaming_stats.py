@@ -0,0 +1,154 @@
+"""
+경기별 값을 리스트로 모으지 않고 개수, 평균, 분산(M2), 최솟값/최댓값만 누적하는 모듈
+누적 결과끼리 합칠 수 있으므로 워커 프로세스(또는 다른 컴퓨터)의 결과를 경기별 값 없이 합칠 수 있다
+
+- RunningStats: Welford 방식 누적 통계 (add, add_many, merge)
+- welch_ttest: 두 누적 통계로 Welch t-test (또는 등분산 t-test)
+- cohens_d: 두 누적 통계의 효과 크기 (Cohen's d)
+- normal_curve: 정규분포 곡선 좌표 (분포 그래프의 정규분포 선)
+"""
+import math
+
+import numpy as np
+from scipy import stats
+
+
+class RunningStats:
+    """
+    값 하나씩(또는 배열로) 누적하는 통계
+
+    속성:
+    - count (int): 값 개수
+    - mean (float): 평균
+    - m2 (float): 평균과의 차이 제곱합 (분산 = m2 / (count - ddof))
+    - min, max (float): 최솟값, 최댓값
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        값 리스트(배열)로 RunningStats 생성
+        """
+        return cls().add_many(values)
+
+    def add(self, value):
+        """
+        값 하나를 누적 (Welford)
+
+        반환값:
+        - RunningStats: self
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        return self
+
+    def add_many(self, values):
+        """
+        값 배열을 한 번에 누적 (배열의 통계를 구해서 merge)
+
+        반환값:
+        - RunningStats: self
+        """
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return self
+        batch = RunningStats()
+        batch.count = values.size
+        batch.mean = float(np.mean(values))
+        batch.m2 = float(np.sum((values - batch.mean) ** 2))
+        batch.min = float(np.min(values))
+        batch.max = float(np.max(values))
+        return self.merge(batch)
+
+    def merge(self, other):
+        """
+        다른 RunningStats 를 합침 (Chan 의 병렬 분산 공식)
+
+        반환값:
+        - RunningStats: self
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def variance(self, ddof=0):
+        """
+        분산 (ddof=0: np.var 와 같은 모분산, ddof=1: 표본분산)
+        """
+        if self.count - ddof <= 0:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        """
+        표준편차 (ddof=0: np.std 와 같은 값)
+        """
+        return math.sqrt(self.variance(ddof))
+
+    def __repr__(self):
+        return f"RunningStats(count={self.count}, mean={self.mean}, std={self.std()}, min={self.min}, max={self.max})"
+
+
+def welch_ttest(a, b, equal_var=False):
+    """
+    두 누적 통계로 t-test 를 하는 함수 (경기별 값 없이 stats.ttest_ind 와 같은 결과)
+
+    매개변수:
+    - a, b (RunningStats): 두 그룹의 누적 통계
+    - equal_var (bool): True 이면 등분산 t-test (stats.ttest_ind 기본값), False 이면 Welch t-test
+
+    반환값:
+    - float: t-statistic
+    - float: p-value
+    """
+    t_stat, p_value = stats.ttest_ind_from_stats(a.mean, a.std(ddof=1), a.count, b.mean, b.std(ddof=1), b.count,
+                                                 equal_var=equal_var)
+    return t_stat, p_value
+
+
+def cohens_d(a, b):
+    """
+    두 누적 통계의 효과 크기 (평균 차이 / 합동 표준편차)
+    """
+    dof = a.count + b.count - 2
+    if dof <= 0:
+        return math.nan
+    pooled_std = math.sqrt((a.m2 + b.m2) / dof)
+    if pooled_std == 0:
+        return math.nan
+    return (a.mean - b.mean) / pooled_std
+
+
+def normal_curve(running_stats, num=100):
+    """
+    누적 통계의 최솟값~최댓값 구간에서 정규분포 곡선 좌표를 구하는 함수
+
+    반환값:
+    - np.ndarray: x 좌표
+    - np.ndarray: 정규분포 밀도
+    """
+    x = np.linspace(running_stats.min, running_stats.max, num)
+    return x, stats.norm.pdf(x, running_stats.mean, running_stats.std())
@@ -1,63 +1,7 @@
-import json
+from event_store import load_events
 import matplotlib.pyplot as plt
-
-def draw_soccer_field(ax, side, field_dimen=(120, 80)):
-    """
-    축구 필드 그리기
-
-    매개변수:
-    - ax (matplotlib.axes): 필드를 그릴 matplotlib 축
-    - field_dimen (tuple): 필드의 크기 (길이, 너비)
-
-    반환값:
-    - ax (matplotlib.axes): 축구 필드가 그려진 matplotlib 축
-    """
-    field_length, field_width = field_dimen
-
-    # 필드 외곽선
-    ax.plot([0, 0, field_length, field_length, 0], [0, field_width, field_width, 0, 0], color="black")
-
-    # 홈/어웨이 진영 배경색 표시
-    if side == 'home':
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-    elif side == 'away':
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-
-
-    # 센터 라인
-    ax.plot([field_length / 2, field_length / 2], [0, field_width], color="black")
-
-    # 센터 서클
-    center_circle = plt.Circle((field_length / 2, field_width / 2), 9.15, color="black", fill=False)
-    ax.add_patch(center_circle)
-    ax.scatter(field_length / 2, field_width / 2, color="black", s=20)  # 센터 스팟
-
-    # 페널티 구역
-    ax.plot([0, 16.5, 16.5, 0], [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-                                  (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-    ax.plot([field_length, field_length - 16.5, field_length - 16.5, field_length],
-            [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-             (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-
-    # 골키퍼 구역
-    ax.plot([0, 5.5, 5.5, 0], [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-                                (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-    ax.plot([field_length, field_length - 5.5, field_length - 5.5, field_length],
-            [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-             (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-
-    # 골대
-    ax.plot([0, -2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([0, -2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-
-    ax.set_xlim(-5, field_length + 5)
-    ax.set_ylim(-5, field_width + 5)
-    ax.set_aspect("equal", adjustable="box")
-    return ax
+from match_context import RelatedEventsGraph
+from pitch import draw_soccer_field
 
 def extract_turnover_data(events_file_path, side):
     """
@@ -74,8 +18,7 @@ def extract_turnover_data(events_file_path, side):
     """
     
     # 데이터 로드
-    with open(events_file_path, 'r', encoding='utf-8') as f:
-        events_data = json.load(f)
+    events_data = load_events(events_file_path)
     
 
     # 선택된 팀 이름
@@ -85,8 +28,8 @@ def extract_turnover_data(events_file_path, side):
         team_name = events_data[1]['team']['name']
 
 
-    # 전체 event id 추출 -> 드리블 실패 데이터 추출에서 사용
-    event_id = [event['id'] for event in events_data if event.get('team',{}).get('name') != team_name]
+    # event id -> 팀 인덱스 -> 드리블 실패 데이터 추출에서 사용
+    related_graph = RelatedEventsGraph(events_data)
     
     # 위치 데이터 추출
     failed_passes_location = []
@@ -94,8 +37,6 @@ def extract_turnover_data(events_file_path, side):
     dribble_losts_location = []
     for event in events_data:
         
-        related_event_list = event.get('related_events',[])
-        
         # 실패한 패스 필터링
         if event["type"]["name"] == "Pass" and "outcome" in event.get("pass", {}) and\
         event["pass"]["outcome"]["name"] == "Incomplete" and event["team"]["name"] == team_name:
@@ -111,7 +52,7 @@ def extract_turnover_data(events_file_path, side):
         
         # 드리블 실패 필터링
         elif event["type"]["name"] == "Carry" and event["team"]["name"] == team_name and\
-                any(related_event in event_id for related_event in related_event_list):
+                related_graph.linked_to_opponent(event['id'], team_name):
             
             dribble_losts_location.append(event['location'])
     